@@ -11,7 +11,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from config import settings
+from config import get_settings
 from utils.logging_config import setup_logging
 from utils.session import init_session_state, get_current_rfp
 from components.progress_dashboard import render_progress_dashboard
@@ -21,14 +21,14 @@ from components.quick_stats import render_quick_stats
 
 # Page configuration
 st.set_page_config(
-    page_title=settings.app_name,
+    page_title=get_settings().app_name,
     page_icon="📄",
     layout="wide",
     initial_sidebar_state="expanded",
     menu_items={
         'Get Help': 'https://github.com/bairesdev/rfp-draft-booster',
         'Report a bug': 'https://github.com/bairesdev/rfp-draft-booster/issues',
-        'About': f'# {settings.app_name}\n\nVersion {settings.version}\n\nAI-powered RFP response automation'
+        'About': f'# {get_settings().app_name}\n\nVersion {get_settings().version}\n\nAI-powered RFP response automation'
     }
 )
 
@@ -121,7 +121,7 @@ def main() -> None:
         <p>Built with ❤️ by BairesDev | Powered by AI</p>
         <p style='font-size: 0.9em;'>Version {version}</p>
     </div>
-    """.format(version=settings.version), unsafe_allow_html=True)
+    """.format(version=get_settings().version), unsafe_allow_html=True)
     
     # Floating chat removed - will use Ask AI buttons per page
 
@@ -14,7 +14,7 @@ from services.file_validator import FileValidator
 from services.storage_manager import StorageManager
 from src.utils.error_handler import PDFError, ValidationError, handle_errors, handle_error
 from src.utils.logger import setup_logger
-from utils.session import init_session_state
+from utils.session import init_session_state, has_cached_extraction, extract_rfp_text
 from components.navigation_flow import render_navigation_buttons
 from components.progress_tracker import ProgressTracker, ProgressStep
 from components.ai_assistant import render_ai_assistant_in_sidebar
@@ -85,10 +85,10 @@ def handle_file_upload(uploaded_file):
     
     # Validation
     with st.spinner("🔍 Validating file..."):
-        is_valid, error_msg = FileValidator.validate_file(
+        is_valid, error_msg, file_hash = FileValidator.validate_and_hash(
             file_name=uploaded_file.name,
             file_size=file_size,
-            file_content=io.BytesIO(uploaded_file.getvalue())
+            file_content=uploaded_file.getvalue()
         )
     
     if not is_valid:
@@ -138,7 +138,8 @@ def handle_file_upload(uploaded_file):
                 rfp_title=rfp_title,
                 client_name=client_name,
                 deadline=deadline,
-                notes=notes
+                notes=notes,
+                file_hash=file_hash
             )
 
 
@@ -148,7 +149,8 @@ def process_rfp(
     rfp_title: str,
     client_name: str,
     deadline: date,
-    notes: str
+    notes: str,
+    file_hash: str = ""
 ):
     """Process the uploaded RFP with enhanced progress tracking."""
     
@@ -159,6 +161,7 @@ def process_rfp(
         title=rfp_title or uploaded_file.name,
         file_name=uploaded_file.name,
         file_size=len(uploaded_file.getvalue()),
+        file_hash=file_hash,
         client_name=client_name or "",
         deadline=datetime.combine(deadline, datetime.min.time()) if deadline else None,
         notes=notes or "",
@@ -205,13 +208,14 @@ def process_rfp(
         tracker.update_substep("Analyzing PDF structure...")
         
         rfp.processing_start = datetime.now()
-        file_content.seek(0)
         
-        tracker.update_substep(f"Extracting text from {rfp.total_pages or '?'} pages...")
-        full_text, text_by_page, page_count = processor.extract_text(
-            pdf_file=file_content,
-            preserve_layout=True
-        )
+        # Same bytes as an earlier upload this session: reuse its extraction
+        if has_cached_extraction(file_hash):
+            tracker.update_substep("Reusing text from identical upload...")
+        else:
+            tracker.update_substep(f"Extracting text from {rfp.total_pages or '?'} pages...")
+        file_content.seek(0)
+        full_text, text_by_page, page_count = extract_rfp_text(processor, file_content, file_hash)
         
         rfp.extracted_text = full_text
         rfp.extracted_text_by_page = text_by_page
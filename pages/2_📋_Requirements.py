@@ -8,7 +8,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from models.rfp import RFP
-from models.requirement import Requirement, RequirementCategory, RequirementPriority
+from models.requirement import Requirement, RequirementCategory, RequirementPriority, summarize_requirements
 from services.requirement_extractor import RequirementExtractor, extract_requirements_from_rfp
 from services.llm_client import LLMClient, create_llm_client, LLMProvider, get_available_provider_names
 from src.utils.error_handler import LLMError, ValidationError, handle_errors, handle_error
@@ -61,7 +61,7 @@ def display_requirement_table(requirements: List[Requirement], filter_category:
     table_data = []
     for req in filtered:
         table_data.append({
-            "ID": req.id[:8] + "...",
+            "ID": req.id[:12] + "...",
             "Category": f"{req.get_category_icon()} {req.category.value.title()}",
             "Priority": f"<span style='color: {req.get_priority_color()}; font-weight: bold;'>{req.priority.value.upper()}</span>",
             "Description": req.description[:100] + "..." if len(req.description) > 100 else req.description,
@@ -101,7 +101,7 @@ def display_requirement_table(requirements: List[Requirement], filter_category:
         col1, col2, col3, col4, col5, col6, col7, col8 = st.columns([1, 1.5, 2, 3, 1, 0.8, 0.8, 1.5])
         
         with col1:
-            st.text(req.id[:8])
+            st.text(req.id[:12])
         with col2:
             st.text(f"{req.get_category_icon()} {req.category.value.title()}")
         with col3:
@@ -354,33 +354,28 @@ def display_statistics(requirements: List[Requirement]):
     
     st.markdown("### 📊 Statistics")
     
+    stats = summarize_requirements(requirements)
+    
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
-        st.metric("Total", len(requirements))
+        st.metric("Total", stats["total"])
     
     with col2:
-        verified_count = sum(1 for r in requirements if r.verified)
-        st.metric("Verified", f"{verified_count}/{len(requirements)}")
+        st.metric("Verified", f"{stats['verified']}/{stats['total']}")
     
     with col3:
-        avg_confidence = sum(r.confidence for r in requirements) / len(requirements) if requirements else 0
-        st.metric("Avg Confidence", f"{avg_confidence:.0%}")
+        st.metric("Avg Confidence", f"{stats['avg_confidence']:.0%}")
     
     with col4:
-        critical_count = sum(1 for r in requirements if r.priority == RequirementPriority.CRITICAL)
-        st.metric("Critical", critical_count)
+        st.metric("Critical", stats["critical"])
     
     with col5:
-        high_confidence = sum(1 for r in requirements if r.confidence >= 0.8)
-        st.metric("High Confidence", high_confidence)
+        st.metric("High Confidence", stats["high_confidence"])
     
     # Category breakdown
     st.markdown("#### By Category")
-    category_counts = {}
-    for req in requirements:
-        cat = req.category.value
-        category_counts[cat] = category_counts.get(cat, 0) + 1
+    category_counts = stats["category_counts"]
     
     cat_cols = st.columns(len(category_counts))
     for i, (cat, count) in enumerate(category_counts.items()):
@@ -134,7 +134,7 @@ def render_matches_table(
         
         rows.append({
             "": color_indicator,
-            "Req ID": match.requirement_id[:8],
+            "Req ID": match.requirement_id[:12],
             "Requirement": match.requirement_description[:60] + "..." if len(match.requirement_description) > 60 else match.requirement_description,
             "Category": match.requirement_category.value.title(),
             "Matched Service": match.service_name,
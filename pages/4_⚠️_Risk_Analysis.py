@@ -94,7 +94,7 @@ def display_risk_table(risks: List[Risk], filter_category: Optional[str], filter
         col1, col2, col3, col4, col5, col6, col7, col8 = st.columns([1, 1.5, 2, 3, 1, 0.8, 0.8, 1.5])
         
         with col1:
-            st.text(risk.id[:8] + "...")
+            st.text(risk.id[:13] + "...")
         
         with col2:
             st.markdown(f"{get_category_icon(risk.category)} {risk.category.value.title()}")
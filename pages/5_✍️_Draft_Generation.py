@@ -392,6 +392,18 @@ def generate_draft_ui(rfp: RFP, requirements: List[Requirement], risks: List[Ris
         # Create generator
         generator = DraftGenerator(llm_client=llm_client, temperature=0.7)
         
+        # Sections are generated concurrently; show each one as it lands
+        total_sections = len(DraftGenerator.STANDARD_SECTIONS)
+        progress = st.progress(0.0, text="✍️ Writing sections...")
+        completed_sections = []
+        
+        def show_section_progress(section):
+            completed_sections.append(section)
+            progress.progress(
+                len(completed_sections) / total_sections,
+                text=f"✍️ {section.title} ready ({len(completed_sections)}/{total_sections})"
+            )
+        
         # Generate draft
         draft = generator.generate_draft(
             rfp=rfp,
@@ -401,7 +413,8 @@ def generate_draft_ui(rfp: RFP, requirements: List[Requirement], risks: List[Ris
             instructions=instructions,
             tone=tone,
             audience=audience,
-            word_count=word_count
+            word_count=word_count,
+            on_section=show_section_progress
         )
         
         # Store in session state
@@ -13,7 +13,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from config import settings
+from config import get_settings
 from utils.session import get_current_rfp
 from components.roi_calculator import (
     render_roi_calculator,
@@ -27,7 +27,7 @@ from utils.calculations import calculate_full_roi
 
 # Page configuration
 st.set_page_config(
-    page_title=f"ROI Calculator - {settings.app_name}",
+    page_title=f"ROI Calculator - {get_settings().app_name}",
     page_icon="💰",
     layout="wide"
 )
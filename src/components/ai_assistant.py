@@ -93,11 +93,11 @@ def render_ai_assistant_modal(key_suffix: str = "", page_context: str = ""):
     risks = st.session_state.get("risks", [])
     
     # Display conversation history
-    history = assistant.get_history()
+    history = assistant.get_history(limit=10)
     
     if history:
         st.markdown("#### 💬 Conversation History")
-        for i, msg in enumerate(history[-10:]):  # Show last 10 messages
+        for i, msg in enumerate(history):  # Show last 10 messages
             role = msg["role"]
             content = msg["content"]
             
@@ -212,9 +212,9 @@ def render_ai_assistant_in_sidebar():
             st.markdown("---")
             
             # Display conversation history (last 5 messages)
-            history = assistant.get_history()
+            history = assistant.get_history(limit=5)
             if history:
-                for msg in history[-5:]:  # Show last 5 only (sidebar is narrow)
+                for msg in history:  # Show last 5 only (sidebar is narrow)
                     role = msg["role"]
                     content = msg["content"]
                     
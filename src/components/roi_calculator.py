@@ -6,7 +6,6 @@ to estimate time and cost savings from using RFP Draft Booster.
 """
 
 import logging
-import pandas as pd
 import streamlit as st
 from typing import Optional
 
@@ -30,6 +29,9 @@ MAX_TIME_PER_PAGE = 5.0
 STEP_TIME_PER_PAGE = 0.5
 STEP_HOURLY_RATE = 10
 
+# Layout: shared width ratios for button rows
+ACTION_COLUMN_WIDTHS = [2, 2, 1]
+
 
 def init_roi_session_state():
     """Initialize ROI calculator session state variables."""
@@ -67,6 +69,9 @@ def generate_roi_report(
     Returns:
         CSV string
     """
+    # Imported lazily: pandas is heavy and only needed for export/charts
+    import pandas as pd
+    
     report_data = {
         "Metric": [
             "RFP Pages",
@@ -167,8 +172,7 @@ def render_roi_calculator():
         )
         
         # Display metrics
-        st.markdown("---")
-        st.markdown("### 📈 Your Estimated Savings")
+        st.markdown("---\n### 📈 Your Estimated Savings")
         
         metric_col1, metric_col2, metric_col3 = st.columns(3)
         
@@ -213,37 +217,31 @@ def render_roi_calculator():
         )
         
         if show_chart:
-            comparison_data = pd.DataFrame({
-                "Process": ["Manual", "Automated"],
-                "Time (hours)": [
-                    metrics['manual_time'],
-                    metrics['automated_time']
-                ],
-                "Cost (USD)": [
-                    metrics['cost_manual'],
-                    metrics['cost_automated']
-                ]
-            })
-            
             chart_col1, chart_col2 = st.columns(2)
             
             with chart_col1:
                 st.bar_chart(
-                    comparison_data.set_index("Process")["Time (hours)"],
+                    {"Time (hours)": {
+                        "Manual": metrics['manual_time'],
+                        "Automated": metrics['automated_time']
+                    }},
                     height=250
                 )
                 st.caption("⏱️ Time Comparison")
             
             with chart_col2:
                 st.bar_chart(
-                    comparison_data.set_index("Process")["Cost (USD)"],
+                    {"Cost (USD)": {
+                        "Manual": metrics['cost_manual'],
+                        "Automated": metrics['cost_automated']
+                    }},
                     height=250
                 )
                 st.caption("💰 Cost Comparison")
         
         # Action buttons
         st.markdown("---")
-        action_col1, action_col2, action_col3 = st.columns([2, 2, 1])
+        action_col1, action_col2, _ = st.columns(ACTION_COLUMN_WIDTHS)
         
         with action_col1:
             if st.button(
@@ -308,10 +306,9 @@ def render_roi_calculator():
 
 def render_cta_section():
     """Render call-to-action section with navigation buttons."""
-    st.markdown("---")
-    st.markdown("### 🚀 Ready to Get Started?")
+    st.markdown("---\n### 🚀 Ready to Get Started?")
     
-    cta_col1, cta_col2, cta_col3 = st.columns([2, 2, 1])
+    cta_col1, cta_col2, _ = st.columns(ACTION_COLUMN_WIDTHS)
     
     with cta_col1:
         if st.button(
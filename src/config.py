@@ -1,5 +1,6 @@
 """Configuration management for RFP Draft Booster."""
 
+from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings
 
@@ -51,6 +52,15 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the shared settings instance, loading `.env` on first use."""
+    return Settings()
+
+
+def __getattr__(name: str):
+    """Keep `from config import settings` working without import-time loading."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
@@ -21,11 +21,6 @@ class StorageError(RFPDraftBoosterException):
     pass
 
 
-class PDFProcessingError(RFPDraftBoosterException):
-    """Raised when PDF processing fails."""
-    pass
-
-
 class InvalidRFPError(RFPDraftBoosterException):
     """Raised when RFP validation fails."""
     pass
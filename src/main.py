@@ -5,21 +5,21 @@ It provides the home page and navigation to other pages.
 """
 
 import streamlit as st
-from config import settings
+from config import get_settings
 from utils.logging_config import setup_logging
 from utils.session import init_session_state
 
 
 # Page configuration
 st.set_page_config(
-    page_title=settings.app_name,
+    page_title=get_settings().app_name,
     page_icon="📄",
     layout="wide",
     initial_sidebar_state="expanded",
     menu_items={
         'Get Help': 'https://github.com/bairesdev/rfp-draft-booster',
         'Report a bug': 'https://github.com/bairesdev/rfp-draft-booster/issues',
-        'About': f'# {settings.app_name}\n\nVersion {settings.version}\n\nAI-powered RFP response automation'
+        'About': f'# {get_settings().app_name}\n\nVersion {get_settings().version}\n\nAI-powered RFP response automation'
     }
 )
 
@@ -105,7 +105,7 @@ def main() -> None:
         <p>Built with ❤️ by BairesDev | Powered by AI</p>
         <p style='font-size: 0.9em;'>Version {version}</p>
     </div>
-    """.format(version=settings.version), unsafe_allow_html=True)
+    """.format(version=get_settings().version), unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
@@ -1,26 +1,44 @@
-"""Data models for RFP Draft Booster."""
+"""Data models for RFP Draft Booster.
+
+Model classes are resolved lazily (PEP 562) so importing one model does
+not pay for loading every submodule.
+"""
+
+import importlib
 
-from models.rfp import RFP, RFPStatus
-from models.requirement import Requirement, RequirementCategory, RequirementPriority
-from models.service import Service, ServiceCategory
-from models.risk import Risk, RiskCategory, RiskSeverity
-from models.draft import Draft, DraftStatus, DraftSection, GenerationMethod
 # ServiceMatch is defined in services.service_matcher for circular dependency reasons
+_LAZY_IMPORTS = {
+    "RFP": "rfp",
+    "RFPStatus": "rfp",
+    "Requirement": "requirement",
+    "RequirementCategory": "requirement",
+    "RequirementPriority": "requirement",
+    "Service": "service",
+    "ServiceCategory": "service",
+    "Risk": "risk",
+    "RiskCategory": "risk",
+    "RiskSeverity": "risk",
+    "Draft": "draft",
+    "DraftStatus": "draft",
+    "DraftSection": "draft",
+    "GenerationMethod": "draft",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    """Import the submodule defining `name` on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
 
-__all__ = [
-    "RFP",
-    "RFPStatus",
-    "Requirement",
-    "RequirementCategory",
-    "RequirementPriority",
-    "Service",
-    "ServiceCategory",
-    "Risk",
-    "RiskCategory",
-    "RiskSeverity",
-    "Draft",
-    "DraftStatus",
-    "DraftSection",
-    "GenerationMethod",
-]
 
+def __dir__():
+    """List lazily-exported names alongside module globals."""
+    return sorted(set(globals()) | set(__all__))
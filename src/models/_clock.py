@@ -0,0 +1,38 @@
+"""
+Timestamp helpers for models.
+
+Batch builders (requirement extraction, risk detection) create many models
+in one go. Inside `shared_now()` every model timestamp default resolves to
+the same instant instead of reading the clock per field per instance.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Iterator, Optional
+
+_shared_now: ContextVar[Optional[datetime]] = ContextVar("shared_now", default=None)
+
+
+def now() -> datetime:
+    """Return the batch timestamp if one is active, else the current time."""
+    value = _shared_now.get()
+    return value if value is not None else datetime.now()
+
+
+@contextmanager
+def shared_now(value: Optional[datetime] = None) -> Iterator[datetime]:
+    """Use one timestamp for all models created within the block."""
+    value = value or datetime.now()
+    token = _shared_now.set(value)
+    try:
+        yield value
+    finally:
+        _shared_now.reset(token)
+
+
+def parse_datetime(value):
+    """Parse an ISO-8601 string; datetimes and None pass through unchanged."""
+    if type(value) is str:
+        return datetime.fromisoformat(value) if value else None
+    return value
@@ -0,0 +1,12 @@
+"""Confidence score labelling shared by extracted models."""
+
+from bisect import bisect_right
+
+# Lower bounds for Medium, High and Very High
+_CONFIDENCE_BOUNDS = (0.5, 0.75, 0.9)
+_CONFIDENCE_LABELS = ("Low", "Medium", "High", "Very High")
+
+
+def confidence_label(confidence: float) -> str:
+    """Get human-readable label for a 0.0-1.0 confidence score."""
+    return _CONFIDENCE_LABELS[bisect_right(_CONFIDENCE_BOUNDS, confidence)]
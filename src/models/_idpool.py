@@ -0,0 +1,57 @@
+"""
+Pooled UUID generation for model id factories.
+
+`uuid.uuid4()` reads 16 bytes from `os.urandom` on every call. Models are
+created in batches (one per extracted requirement or risk), so the pool
+reads random bytes in larger chunks and slices one UUID at a time.
+"""
+
+import os
+import threading
+import uuid
+
+# Random bytes fetched per refill (256 UUIDs)
+DEFAULT_CHUNK_SIZE = 4096
+_UUID_BYTES = 16
+
+
+class UUIDPool(threading.local):
+    """Per-thread buffer of random bytes used to build version 4 UUIDs."""
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if chunk_size < _UUID_BYTES or chunk_size % _UUID_BYTES:
+            raise ValueError(f"chunk_size must be a positive multiple of {_UUID_BYTES}, got {chunk_size}")
+        self._chunk_size = chunk_size
+        self._buf = b""
+        self._pos = 0
+
+    def next_uuid(self) -> uuid.UUID:
+        """Return a random (version 4) UUID, refilling the buffer when exhausted."""
+        pos = self._pos
+        if pos >= len(self._buf):
+            self._buf = os.urandom(self._chunk_size)
+            pos = 0
+        self._pos = pos + _UUID_BYTES
+        return uuid.UUID(bytes=self._buf[pos:pos + _UUID_BYTES], version=4)
+
+    def reset(self) -> None:
+        """Discard buffered bytes so the next call reads fresh randomness."""
+        self._buf = b""
+        self._pos = 0
+
+
+_pool = UUIDPool()
+
+# A forked child must not hand out the same ids as its parent
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_pool.reset)
+
+
+def new_uuid() -> uuid.UUID:
+    """Return a random UUID from the shared pool."""
+    return _pool.next_uuid()
+
+
+def new_id(prefix: str) -> str:
+    """Return `prefix` joined to the hex form of a pooled UUID."""
+    return prefix + _pool.next_uuid().hex
@@ -3,11 +3,16 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import partial
 from typing import List, Optional
-from uuid import uuid4
 
+from ._idpool import new_id
 
-class DraftStatus(Enum):
+
+_DATE_FIELDS = ("generated_date", "created_date", "last_modified", "export_date", "approval_date")
+
+
+class DraftStatus(str, Enum):
     """Draft status."""
     GENERATED = "generated"
     EDITING = "editing"
@@ -16,17 +21,25 @@ class DraftStatus(Enum):
     EXPORTED = "exported"
 
 
-class GenerationMethod(Enum):
+class GenerationMethod(str, Enum):
     """How draft was generated."""
     AI = "ai"
     HYBRID = "hybrid"
     MANUAL = "manual"
 
 
-@dataclass
+# Enum -> serialized value, avoiding the enum descriptor on every to_dict
+_DRAFT_STATUS_VALUES = {s: s.value for s in DraftStatus}
+_GENERATION_METHOD_VALUES = {m: m.value for m in GenerationMethod}
+
+# Statuses from which a draft may be exported
+_EXPORTABLE_STATUSES = frozenset({DraftStatus.REVIEWED, DraftStatus.APPROVED})
+
+
+@dataclass(slots=True)
 class DraftSection:
     """Individual section of draft."""
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=partial(new_id, ""))
     section_type: str = ""
     title: str = ""
     content: str = ""
@@ -56,12 +69,12 @@ class DraftSection:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Draft:
     """Generated proposal draft."""
     
     # Core identifiers
-    id: str = field(default_factory=lambda: f"draft-{uuid4()}")
+    id: str = field(default_factory=partial(new_id, "draft-"))
     rfp_id: str = ""
     version: int = 1
     
@@ -74,7 +87,7 @@ class Draft:
     generated_by: GenerationMethod = GenerationMethod.AI
     llm_provider: Optional[str] = None
     generation_time: Optional[float] = None
-    generated_date: datetime = field(default_factory=datetime.now)
+    generated_date: Optional[datetime] = None
     
     # Status
     status: DraftStatus = DraftStatus.GENERATED
@@ -106,13 +119,30 @@ class Draft:
     risk_coverage: Optional[float] = None
     
     # Timestamps
-    created_date: datetime = field(default_factory=datetime.now)
-    last_modified: datetime = field(default_factory=datetime.now)
+    created_date: Optional[datetime] = None
+    last_modified: Optional[datetime] = None
+    
+    def __post_init__(self):
+        """Fill unset timestamps and coerce string enum values."""
+        # One clock read shared by all unset timestamps
+        now = datetime.now()
+        if self.generated_date is None:
+            self.generated_date = now
+        if self.created_date is None:
+            self.created_date = now
+        if self.last_modified is None:
+            self.last_modified = now
+        
+        # Coerce strings so serialization can rely on `.value`
+        if type(self.generated_by) is str:
+            self.generated_by = GenerationMethod(self.generated_by)
+        if type(self.status) is str:
+            self.status = DraftStatus(self.status)
     
     def can_export(self) -> bool:
         """Check if draft is ready for export."""
         return (
-            self.status in [DraftStatus.REVIEWED, DraftStatus.APPROVED]
+            self.status in _EXPORTABLE_STATUSES
             and (self.completeness_score or 0) >= 0.80
             and self.word_count >= 500
         )
@@ -150,11 +180,11 @@ class Draft:
             "content": self.content,
             "sections": [s.to_dict() for s in self.sections],
             "title": self.title,
-            "generated_by": self.generated_by.value if hasattr(self.generated_by, 'value') else str(self.generated_by),
+            "generated_by": _GENERATION_METHOD_VALUES[self.generated_by],
             "llm_provider": self.llm_provider,
             "generation_time": self.generation_time,
             "generated_date": self.generated_date.isoformat(),
-            "status": self.status.value if hasattr(self.status, 'value') else str(self.status),
+            "status": _DRAFT_STATUS_VALUES[self.status],
             "editing_mode": self.editing_mode,
             "word_count": self.word_count,
             "section_count": self.section_count,
@@ -167,19 +197,15 @@ class Draft:
     def from_dict(cls, data: dict) -> "Draft":
         """Create draft from dictionary."""
         # Parse datetime fields
-        for date_field in ["generated_date", "created_date", "last_modified", "export_date", "approval_date"]:
-            if isinstance(data.get(date_field), str):
-                data[date_field] = datetime.fromisoformat(data[date_field])
+        for date_field in _DATE_FIELDS:
+            value = data.get(date_field)
+            if type(value) is str:
+                data[date_field] = datetime.fromisoformat(value)
         
         # Parse sections
         if "sections" in data and isinstance(data["sections"], list):
             data["sections"] = [DraftSection.from_dict(s) if isinstance(s, dict) else s for s in data["sections"]]
         
-        # Parse enums
-        if isinstance(data.get("generated_by"), str):
-            data["generated_by"] = GenerationMethod(data["generated_by"])
-        if isinstance(data.get("status"), str):
-            data["status"] = DraftStatus(data["status"])
-        
+        # Enum strings are coerced in __post_init__
         return cls(**data)
 
@@ -5,11 +5,16 @@ This module defines the data structures for storing and managing extracted requi
 from RFPs, including categorization, prioritization, and confidence scoring.
 """
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
-from typing import Optional
-import uuid
+from functools import partial
+from typing import Iterable, Optional
+
+from ._clock import now, parse_datetime
+from ._confidence import confidence_label
+from ._idpool import new_id
 
 
 class RequirementCategory(str, Enum):
@@ -31,7 +36,28 @@ class RequirementPriority(str, Enum):
     LOW = "low"
 
 
-@dataclass
+# Value -> member maps, cheaper than Enum(value) for string coercion
+_CATEGORY_BY_VALUE = {c.value: c for c in RequirementCategory}
+_PRIORITY_BY_VALUE = {p.value: p for p in RequirementPriority}
+
+# UI lookup tables
+_PRIORITY_COLORS = {
+    RequirementPriority.CRITICAL: "#FF4444",  # Red
+    RequirementPriority.HIGH: "#FF8800",  # Orange
+    RequirementPriority.MEDIUM: "#FFBB00",  # Yellow
+    RequirementPriority.LOW: "#4CAF50",  # Green
+}
+
+_CATEGORY_ICONS = {
+    RequirementCategory.TECHNICAL: "⚙️",
+    RequirementCategory.FUNCTIONAL: "🎯",
+    RequirementCategory.TIMELINE: "📅",
+    RequirementCategory.BUDGET: "💰",
+    RequirementCategory.COMPLIANCE: "✅",
+}
+
+
+@dataclass(slots=True, eq=False)
 class Requirement:
     """
     Represents a single requirement extracted from an RFP.
@@ -51,7 +77,7 @@ class Requirement:
     """
     
     # Core fields
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=partial(new_id, "req-"))
     rfp_id: str = ""
     description: str = ""
     
@@ -66,11 +92,15 @@ class Requirement:
     notes: str = ""
     
     # Timestamps
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=now)
+    updated_at: datetime = field(default_factory=now)
     
     def __post_init__(self):
         """Validate fields after initialization."""
+        # Many models share one rfp_id; intern it so copies share memory
+        if type(self.rfp_id) is str and self.rfp_id:
+            self.rfp_id = sys.intern(self.rfp_id)
+        
         # Ensure confidence is in valid range
         if not 0.0 <= self.confidence <= 1.0:
             raise ValueError(f"Confidence must be between 0.0 and 1.0, got {self.confidence}")
@@ -80,11 +110,27 @@ class Requirement:
             raise ValueError(f"Page number must be >= 1, got {self.page_number}")
         
         # Convert string category/priority to enum if needed
-        if isinstance(self.category, str):
-            self.category = RequirementCategory(self.category.lower())
+        if type(self.category) is str:
+            try:
+                self.category = _CATEGORY_BY_VALUE[self.category.lower()]
+            except KeyError:
+                raise ValueError(f"{self.category!r} is not a valid RequirementCategory") from None
         
-        if isinstance(self.priority, str):
-            self.priority = RequirementPriority(self.priority.lower())
+        if type(self.priority) is str:
+            try:
+                self.priority = _PRIORITY_BY_VALUE[self.priority.lower()]
+            except KeyError:
+                raise ValueError(f"{self.priority!r} is not a valid RequirementPriority") from None
+    
+    def __eq__(self, other: object) -> bool:
+        """Requirements are equal when they share an id."""
+        if type(other) is not Requirement:
+            return NotImplemented
+        return self.id == other.id
+    
+    def __hash__(self) -> int:
+        """Hash by id, consistent with __eq__."""
+        return hash(self.id)
     
     def to_dict(self) -> dict:
         """Convert requirement to dictionary for serialization."""
@@ -105,53 +151,84 @@ class Requirement:
     @classmethod
     def from_dict(cls, data: dict) -> "Requirement":
         """Create requirement from dictionary."""
-        # Parse datetime fields
-        if isinstance(data.get("created_at"), str):
-            data["created_at"] = datetime.fromisoformat(data["created_at"])
-        if isinstance(data.get("updated_at"), str):
-            data["updated_at"] = datetime.fromisoformat(data["updated_at"])
-        
-        return cls(**data)
+        # Explicit construction; missing keys fall back to field defaults
+        return cls(
+            id=data.get("id") or new_id("req-"),
+            rfp_id=data.get("rfp_id", ""),
+            description=data.get("description", ""),
+            category=data.get("category", RequirementCategory.FUNCTIONAL),
+            priority=data.get("priority", RequirementPriority.MEDIUM),
+            confidence=data.get("confidence", 0.0),
+            page_number=data.get("page_number"),
+            verified=data.get("verified", False),
+            notes=data.get("notes", ""),
+            created_at=parse_datetime(data.get("created_at")) or now(),
+            updated_at=parse_datetime(data.get("updated_at")) or now(),
+        )
     
     def update(self, **kwargs) -> None:
         """Update requirement fields and timestamp."""
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in _FIELD_NAMES:
                 setattr(self, key, value)
         
         self.updated_at = datetime.now()
     
     def get_confidence_label(self) -> str:
         """Get human-readable confidence label."""
-        if self.confidence >= 0.9:
-            return "Very High"
-        elif self.confidence >= 0.75:
-            return "High"
-        elif self.confidence >= 0.5:
-            return "Medium"
-        else:
-            return "Low"
+        return confidence_label(self.confidence)
     
     def get_priority_color(self) -> str:
         """Get color code for priority (for UI)."""
-        colors = {
-            RequirementPriority.CRITICAL: "#FF4444",  # Red
-            RequirementPriority.HIGH: "#FF8800",  # Orange
-            RequirementPriority.MEDIUM: "#FFBB00",  # Yellow
-            RequirementPriority.LOW: "#4CAF50",  # Green
-        }
-        return colors.get(self.priority, "#808080")
+        return _PRIORITY_COLORS.get(self.priority, "#808080")
     
     def get_category_icon(self) -> str:
         """Get emoji icon for category (for UI)."""
-        icons = {
-            RequirementCategory.TECHNICAL: "⚙️",
-            RequirementCategory.FUNCTIONAL: "🎯",
-            RequirementCategory.TIMELINE: "📅",
-            RequirementCategory.BUDGET: "💰",
-            RequirementCategory.COMPLIANCE: "✅",
-        }
-        return icons.get(self.category, "📋")
+        return _CATEGORY_ICONS.get(self.category, "📋")
+
+
+# Field names accepted by Requirement.update()
+_FIELD_NAMES = frozenset(f.name for f in fields(Requirement))
+
+
+def summarize_requirements(requirements: Iterable[Requirement], high_confidence: float = 0.8) -> dict:
+    """
+    Compute list-level statistics in a single pass.
+    
+    Args:
+        requirements: Requirements to summarize
+        high_confidence: Threshold for counting high-confidence requirements
+    
+    Returns:
+        Dict with total, verified, critical, high_confidence and
+        avg_confidence, plus category_counts keyed by category value
+        in first-seen order
+    """
+    total = verified = critical = confident = 0
+    confidence_sum = 0.0
+    category_counts: dict[str, int] = {}
+    
+    for req in requirements:
+        total += 1
+        confidence = req.confidence
+        confidence_sum += confidence
+        if req.verified:
+            verified += 1
+        if req.priority is RequirementPriority.CRITICAL:
+            critical += 1
+        if confidence >= high_confidence:
+            confident += 1
+        category = req.category.value
+        category_counts[category] = category_counts.get(category, 0) + 1
+    
+    return {
+        "total": total,
+        "verified": verified,
+        "critical": critical,
+        "high_confidence": confident,
+        "avg_confidence": confidence_sum / total if total else 0.0,
+        "category_counts": category_counts,
+    }
 
 
 def get_category_display_names() -> dict[str, str]:
@@ -1,13 +1,16 @@
 """RFP data model."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import partial
 from typing import Optional
-from uuid import uuid4
 
+from ._idpool import new_id
 
-class RFPStatus(Enum):
+
+class RFPStatus(str, Enum):
     """RFP processing status."""
     UPLOADED = "uploaded"
     PROCESSING = "processing"
@@ -15,18 +18,23 @@ class RFPStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+# Statuses from which an RFP may be (re)processed
+_PROCESSABLE_STATUSES = frozenset({RFPStatus.UPLOADED, RFPStatus.ERROR})
+
+
+@dataclass(slots=True, eq=False)
 class RFP:
     """Request for Proposal document."""
     
     # Core identifiers
-    id: str = field(default_factory=lambda: f"rfp-{uuid4()}")
+    id: str = field(default_factory=partial(new_id, "rfp-"))
     title: str = ""
     file_name: str = ""
     
     # File metadata
     file_size: int = 0
     file_path: str = ""
+    file_hash: str = ""  # SHA-256 of the uploaded bytes
     total_pages: int = 0
     
     # Client information
@@ -56,17 +64,42 @@ class RFP:
     assigned_to: Optional[str] = None
     team: Optional[str] = None
     
-    def is_overdue(self) -> bool:
-        """Check if RFP deadline has passed."""
+    def __post_init__(self):
+        """Intern ownership strings repeated across many RFPs."""
+        if type(self.uploaded_by) is str and self.uploaded_by:
+            self.uploaded_by = sys.intern(self.uploaded_by)
+        if type(self.team) is str and self.team:
+            self.team = sys.intern(self.team)
+    
+    def __eq__(self, other: object) -> bool:
+        """RFPs are equal when they share an id."""
+        if type(other) is not RFP:
+            return NotImplemented
+        return self.id == other.id
+    
+    def __hash__(self) -> int:
+        """Hash by id, consistent with __eq__."""
+        return hash(self.id)
+    
+    def is_overdue(self, now: Optional[datetime] = None) -> bool:
+        """Check if RFP deadline has passed.
+        
+        Args:
+            now: Reference time, so callers checking many RFPs can share one clock read
+        """
         if not self.deadline:
             return False
-        return datetime.now() > self.deadline
+        return (now or datetime.now()) > self.deadline
     
-    def days_until_deadline(self) -> int:
-        """Calculate days remaining until deadline."""
+    def days_until_deadline(self, now: Optional[datetime] = None) -> int:
+        """Calculate days remaining until deadline.
+        
+        Args:
+            now: Reference time, so callers checking many RFPs can share one clock read
+        """
         if not self.deadline:
             return -1
-        delta = self.deadline - datetime.now()
+        delta = self.deadline - (now or datetime.now())
         return delta.days
     
     def size_mb(self) -> float:
@@ -76,8 +109,8 @@ class RFP:
     def can_process(self) -> bool:
         """Check if RFP is ready for processing."""
         return (
-            self.status in [RFPStatus.UPLOADED, RFPStatus.ERROR]
-            and self.file_path
+            self.status in _PROCESSABLE_STATUSES
+            and bool(self.file_path)
             and self.file_size > 0
         )
 
@@ -5,11 +5,16 @@ This module defines the data structures for storing and managing detected risks
 from RFPs, including categorization, severity classification, and recommendations.
 """
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
+from functools import partial
 from typing import Optional
-import uuid
+
+from ._clock import now, parse_datetime
+from ._confidence import confidence_label
+from ._idpool import new_id
 
 
 class RiskCategory(str, Enum):
@@ -31,7 +36,28 @@ class RiskSeverity(str, Enum):
     LOW = "low"
 
 
-@dataclass
+# Value -> member maps, cheaper than Enum(value) for string coercion
+_CATEGORY_BY_VALUE = {c.value: c for c in RiskCategory}
+_SEVERITY_BY_VALUE = {s.value: s for s in RiskSeverity}
+
+# UI lookup tables
+_SEVERITY_COLORS = {
+    RiskSeverity.CRITICAL: "#FF4444",  # Red
+    RiskSeverity.HIGH: "#FF8800",  # Orange
+    RiskSeverity.MEDIUM: "#FFBB00",  # Yellow
+    RiskSeverity.LOW: "#4CAF50",  # Green
+}
+
+_CATEGORY_ICONS = {
+    RiskCategory.LEGAL: "⚖️",
+    RiskCategory.FINANCIAL: "💰",
+    RiskCategory.TIMELINE: "⏰",
+    RiskCategory.TECHNICAL: "🔧",
+    RiskCategory.COMPLIANCE: "📋",
+}
+
+
+@dataclass(slots=True, eq=False)
 class Risk:
     """
     Represents a single risk detected in an RFP.
@@ -54,7 +80,7 @@ class Risk:
     """
     
     # Core fields
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=partial(new_id, "risk-"))
     rfp_id: str = ""
     clause_text: str = ""
     
@@ -76,11 +102,15 @@ class Risk:
     acknowledged_at: Optional[datetime] = None
     
     # Timestamps
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=now)
+    updated_at: datetime = field(default_factory=now)
     
     def __post_init__(self):
         """Validate fields after initialization."""
+        # Many models share one rfp_id; intern it so copies share memory
+        if type(self.rfp_id) is str and self.rfp_id:
+            self.rfp_id = sys.intern(self.rfp_id)
+        
         # Ensure confidence is in valid range
         if not 0.0 <= self.confidence <= 1.0:
             raise ValueError(f"Confidence must be between 0.0 and 1.0, got {self.confidence}")
@@ -90,11 +120,27 @@ class Risk:
             raise ValueError(f"Page number must be >= 1, got {self.page_number}")
         
         # Convert string category/severity to enum if needed
-        if isinstance(self.category, str):
-            self.category = RiskCategory(self.category.lower())
+        if type(self.category) is str:
+            try:
+                self.category = _CATEGORY_BY_VALUE[self.category.lower()]
+            except KeyError:
+                raise ValueError(f"{self.category!r} is not a valid RiskCategory") from None
         
-        if isinstance(self.severity, str):
-            self.severity = RiskSeverity(self.severity.lower())
+        if type(self.severity) is str:
+            try:
+                self.severity = _SEVERITY_BY_VALUE[self.severity.lower()]
+            except KeyError:
+                raise ValueError(f"{self.severity!r} is not a valid RiskSeverity") from None
+    
+    def __eq__(self, other: object) -> bool:
+        """Risks are equal when they share an id."""
+        if type(other) is not Risk:
+            return NotImplemented
+        return self.id == other.id
+    
+    def __hash__(self) -> int:
+        """Hash by id, consistent with __eq__."""
+        return hash(self.id)
     
     def to_dict(self) -> dict:
         """Convert risk to dictionary for serialization."""
@@ -118,62 +164,55 @@ class Risk:
     @classmethod
     def from_dict(cls, data: dict) -> "Risk":
         """Create risk from dictionary."""
-        # Parse datetime fields
-        if isinstance(data.get("created_at"), str):
-            data["created_at"] = datetime.fromisoformat(data["created_at"])
-        if isinstance(data.get("updated_at"), str):
-            data["updated_at"] = datetime.fromisoformat(data["updated_at"])
-        if isinstance(data.get("acknowledged_at"), str) and data["acknowledged_at"]:
-            data["acknowledged_at"] = datetime.fromisoformat(data["acknowledged_at"])
-        
-        return cls(**data)
+        # Explicit construction; missing keys fall back to field defaults
+        return cls(
+            id=data.get("id") or new_id("risk-"),
+            rfp_id=data.get("rfp_id", ""),
+            clause_text=data.get("clause_text", ""),
+            category=data.get("category", RiskCategory.LEGAL),
+            severity=data.get("severity", RiskSeverity.MEDIUM),
+            confidence=data.get("confidence", 0.0),
+            page_number=data.get("page_number"),
+            recommendation=data.get("recommendation", ""),
+            alternative_language=data.get("alternative_language", ""),
+            acknowledged=data.get("acknowledged", False),
+            acknowledgment_notes=data.get("acknowledgment_notes", ""),
+            acknowledged_at=parse_datetime(data.get("acknowledged_at")),
+            created_at=parse_datetime(data.get("created_at")) or now(),
+            updated_at=parse_datetime(data.get("updated_at")) or now(),
+        )
     
     def update(self, **kwargs) -> None:
         """Update risk fields and timestamp."""
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in _FIELD_NAMES:
                 setattr(self, key, value)
         
         self.updated_at = datetime.now()
     
     def acknowledge(self, notes: str = "") -> None:
         """Acknowledge this risk with optional notes."""
+        now = datetime.now()
         self.acknowledged = True
         self.acknowledgment_notes = notes
-        self.acknowledged_at = datetime.now()
-        self.updated_at = datetime.now()
+        self.acknowledged_at = now
+        self.updated_at = now
     
     def get_confidence_label(self) -> str:
         """Get human-readable confidence label."""
-        if self.confidence >= 0.9:
-            return "Very High"
-        elif self.confidence >= 0.75:
-            return "High"
-        elif self.confidence >= 0.5:
-            return "Medium"
-        else:
-            return "Low"
+        return confidence_label(self.confidence)
     
     def get_severity_color(self) -> str:
         """Get color code for severity (for UI)."""
-        colors = {
-            RiskSeverity.CRITICAL: "#FF4444",  # Red
-            RiskSeverity.HIGH: "#FF8800",  # Orange
-            RiskSeverity.MEDIUM: "#FFBB00",  # Yellow
-            RiskSeverity.LOW: "#4CAF50",  # Green
-        }
-        return colors.get(self.severity, "#808080")
+        return _SEVERITY_COLORS.get(self.severity, "#808080")
     
     def get_category_icon(self) -> str:
         """Get emoji icon for category (for UI)."""
-        icons = {
-            RiskCategory.LEGAL: "⚖️",
-            RiskCategory.FINANCIAL: "💰",
-            RiskCategory.TIMELINE: "⏰",
-            RiskCategory.TECHNICAL: "🔧",
-            RiskCategory.COMPLIANCE: "📋",
-        }
-        return icons.get(self.category, "⚠️")
+        return _CATEGORY_ICONS.get(self.category, "⚠️")
+
+
+# Field names accepted by Risk.update()
+_FIELD_NAMES = frozenset(f.name for f in fields(Risk))
 
 
 def get_category_display_names() -> dict[str, str]:
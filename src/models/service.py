@@ -4,12 +4,19 @@ This module defines the Service data model and related enums for
 matching BairesDev services to RFP requirements.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Sequence
 import json
 from pathlib import Path
 
+# orjson is optional; it parses bytes directly and is several times faster
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class ServiceCategory(str, Enum):
     """Service category enum."""
@@ -20,7 +27,14 @@ class ServiceCategory(str, Enum):
     COMPLIANCE = "compliance"
 
 
-@dataclass
+# Value -> member map, cheaper than Enum(value) for string coercion
+_CATEGORY_BY_VALUE = {c.value: c for c in ServiceCategory}
+
+# Shared immutable default; replaced by a list on first add_tag()
+_NO_TAGS: tuple = ()
+
+
+@dataclass(slots=True, eq=False)
 class Service:
     """Service model for service catalog.
     
@@ -33,23 +47,36 @@ class Service:
     description: str
     capabilities: List[str]
     success_rate: float = 0.95  # Default 95% success rate
-    tags: List[str] = field(default_factory=list)
+    tags: Sequence[str] = _NO_TAGS
     
     def __post_init__(self):
         """Validate service data after initialization."""
         # Convert category string to enum if needed
-        if isinstance(self.category, str):
-            self.category = ServiceCategory(self.category)
+        if type(self.category) is str:
+            try:
+                self.category = _CATEGORY_BY_VALUE[self.category]
+            except KeyError:
+                raise ValueError(f"{self.category!r} is not a valid ServiceCategory") from None
         
         # Validate success rate
         if not 0.0 <= self.success_rate <= 1.0:
             raise ValueError(f"Success rate must be between 0.0 and 1.0, got {self.success_rate}")
         
-        # Ensure capabilities and tags are lists
+        # Ensure capabilities is a list and tags a sequence
         if not isinstance(self.capabilities, list):
             self.capabilities = [self.capabilities] if self.capabilities else []
-        if not isinstance(self.tags, list):
-            self.tags = [self.tags] if self.tags else []
+        if not isinstance(self.tags, (list, tuple)):
+            self.tags = [self.tags] if self.tags else _NO_TAGS
+    
+    def __eq__(self, other: object) -> bool:
+        """Services are equal when they share an id."""
+        if type(other) is not Service:
+            return NotImplemented
+        return self.id == other.id
+    
+    def __hash__(self) -> int:
+        """Hash by id, consistent with __eq__."""
+        return hash(self.id)
     
     def to_dict(self) -> dict:
         """Convert service to dictionary."""
@@ -60,7 +87,7 @@ class Service:
             "description": self.description,
             "capabilities": self.capabilities,
             "success_rate": self.success_rate,
-            "tags": self.tags
+            "tags": list(self.tags)
         }
     
     @classmethod
@@ -73,21 +100,24 @@ class Service:
             description=data["description"],
             capabilities=data.get("capabilities", []),
             success_rate=data.get("success_rate", 0.95),
-            tags=data.get("tags", [])
+            tags=data.get("tags") or _NO_TAGS
         )
     
+    def add_tag(self, tag: str) -> None:
+        """Append a tag, copying the shared empty default on first write."""
+        if type(self.tags) is not list:
+            self.tags = list(self.tags)
+        self.tags.append(tag)
+    
     def get_full_text(self) -> str:
         """Get full text representation for matching.
         
         Combines name, description, capabilities, and tags into
         a single text string for TF-IDF vectorization.
         """
-        text_parts = [
-            self.name,
-            self.description,
-            " ".join(self.capabilities),
-            " ".join(self.tags)
-        ]
+        text_parts = [self.name, self.description]
+        text_parts.extend(self.capabilities)
+        text_parts.extend(self.tags)
         return " ".join(filter(None, text_parts))
 
 
@@ -111,8 +141,8 @@ def load_services_from_json(file_path: str = "data/services.json") -> List[Servi
         raise FileNotFoundError(f"Services file not found: {file_path}")
     
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        data = _json_loads(path.read_bytes())
     except json.JSONDecodeError as e:
         raise json.JSONDecodeError(
             f"Invalid JSON in {file_path}: {e.msg}",
@@ -142,55 +172,63 @@ def load_services_from_json(file_path: str = "data/services.json") -> List[Servi
     return services
 
 
+# Minimal BairesDev catalog used when services.json is missing. Built once at
+# import; callers get copies so edits never leak into the shared templates.
+_DEFAULT_SERVICES = (
+    Service(
+        id="cloud-infrastructure",
+        name="Cloud Infrastructure & DevOps",
+        category=ServiceCategory.TECHNICAL,
+        description="Design and implement scalable cloud infrastructure with CI/CD pipelines",
+        capabilities=[
+            "AWS/Azure/GCP deployment",
+            "Kubernetes orchestration",
+            "Docker containerization",
+            "CI/CD automation",
+            "Infrastructure as Code"
+        ],
+        success_rate=0.96,
+        tags=["cloud", "devops", "kubernetes", "docker", "aws", "azure"]
+    ),
+    Service(
+        id="custom-software-development",
+        name="Custom Software Development",
+        category=ServiceCategory.FUNCTIONAL,
+        description="End-to-end custom software development with agile methodology",
+        capabilities=[
+            "Full-stack development",
+            "Backend API development",
+            "Frontend web applications",
+            "Mobile app development",
+            "Legacy system modernization"
+        ],
+        success_rate=0.95,
+        tags=["development", "agile", "full-stack", "api", "web", "mobile"]
+    ),
+    Service(
+        id="qa-testing",
+        name="QA & Testing Services",
+        category=ServiceCategory.COMPLIANCE,
+        description="Comprehensive quality assurance and testing services",
+        capabilities=[
+            "Automated testing",
+            "Manual testing",
+            "Performance testing",
+            "Security testing",
+            "Test automation frameworks"
+        ],
+        success_rate=0.94,
+        tags=["qa", "testing", "automation", "quality", "security"]
+    ),
+)
+
+
 def get_default_services() -> List[Service]:
     """Get default services if JSON file doesn't exist.
     
     Returns a minimal set of BairesDev services for fallback.
     """
     return [
-        Service(
-            id="cloud-infrastructure",
-            name="Cloud Infrastructure & DevOps",
-            category=ServiceCategory.TECHNICAL,
-            description="Design and implement scalable cloud infrastructure with CI/CD pipelines",
-            capabilities=[
-                "AWS/Azure/GCP deployment",
-                "Kubernetes orchestration",
-                "Docker containerization",
-                "CI/CD automation",
-                "Infrastructure as Code"
-            ],
-            success_rate=0.96,
-            tags=["cloud", "devops", "kubernetes", "docker", "aws", "azure"]
-        ),
-        Service(
-            id="custom-software-development",
-            name="Custom Software Development",
-            category=ServiceCategory.FUNCTIONAL,
-            description="End-to-end custom software development with agile methodology",
-            capabilities=[
-                "Full-stack development",
-                "Backend API development",
-                "Frontend web applications",
-                "Mobile app development",
-                "Legacy system modernization"
-            ],
-            success_rate=0.95,
-            tags=["development", "agile", "full-stack", "api", "web", "mobile"]
-        ),
-        Service(
-            id="qa-testing",
-            name="QA & Testing Services",
-            category=ServiceCategory.COMPLIANCE,
-            description="Comprehensive quality assurance and testing services",
-            capabilities=[
-                "Automated testing",
-                "Manual testing",
-                "Performance testing",
-                "Security testing",
-                "Test automation frameworks"
-            ],
-            success_rate=0.94,
-            tags=["qa", "testing", "automation", "quality", "security"]
-        )
+        replace(s, capabilities=list(s.capabilities), tags=list(s.tags))
+        for s in _DEFAULT_SERVICES
     ]
@@ -6,19 +6,79 @@ about RFP content, requirements, risks, and best practices.
 """
 
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+from collections import Counter, deque
+from itertools import islice
+from typing import Deque, List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
-from models import RFP, Requirement, Risk
+from models import RFP, Requirement, Risk, RiskSeverity
 from services.llm_client import LLMClient, create_llm_client
 from utils.prompt_templates import get_ai_assistant_prompt
 
 logger = logging.getLogger(__name__)
 
+# Oldest messages are dropped once the history reaches this size
+MAX_HISTORY_MESSAGES = 200
+# Most recent messages included in each prompt
+PROMPT_HISTORY_MESSAGES = 5
+
+# Help text per page, injected into the assistant prompt for that page
+_PAGE_HELP: Dict[str, str] = {
+    "upload": """**Upload RFP Page:**
+- Upload PDF files up to 50MB
+- Provide RFP title, client name, deadline, and optional notes
+- The system will extract text from the PDF automatically
+- After upload, navigate to Requirements or Risk Analysis pages
+- Supported formats: PDF only""",
+    "requirements": """**Requirements Extraction Page:**
+- Extract requirements using AI or manual entry
+- Filter by category (Technical, Functional, Timeline, Budget, Compliance)
+- Filter by priority (Critical, High, Medium, Low)
+- Edit, delete, or verify requirements
+- Export requirements to JSON or CSV
+- Import requirements from JSON files
+- Requirements are linked to specific pages in the RFP""",
+    "service_matching": """**Service Matching Page:**
+- Automatically match RFP requirements to BairesDev services
+- Uses TF-IDF vectorization and cosine similarity for matching
+- View match scores (🟢 >80%, 🟡 50-80%, 🔴 <50%)
+- Filter matches by category and minimum score threshold
+- Approve high-confidence matches (>80%) for draft generation
+- View coverage by requirement category with bar chart
+- Export matches to JSON for reference
+- Approved matches are automatically included in proposal drafts
+- Prerequisites: RFP uploaded, requirements extracted""",
+    "risks": """**Risk Analysis Page:**
+- Detect risks using pattern matching or AI
+- Filter by category (Legal, Financial, Timeline, Technical, Compliance)
+- Filter by severity (Critical, High, Medium, Low)
+- Acknowledge risks with notes
+- View recommendations and alternative language suggestions
+- Export risks to JSON or CSV
+- Import risks from JSON files
+- Critical risks may block draft generation""",
+    "draft": """**Draft Generation Page:**
+- Generate proposal drafts with customizable instructions
+- Specify word count, tone, and style preferences
+- Edit drafts directly in the app with real-time preview
+- Regenerate specific sections without regenerating the entire draft
+- Export drafts to Markdown or JSON
+- Approved service matches (>80%) are automatically included
+- Prerequisites: RFP uploaded, requirements extracted, risks acknowledged""",
+    "main": """**Main Page:**
+- Overview of the RFP Draft Booster application
+- Use Global Search to find content across all pages
+- View Progress Dashboard to track completion status
+- Navigate to different pages using the sidebar
+- This is the starting point for processing RFPs""",
+}
+
 
 class AIMessage:
     """Represents a message in the AI Assistant conversation."""
     
+    __slots__ = ("role", "content", "timestamp")
+    
     def __init__(self, role: str, content: str, timestamp: Optional[datetime] = None):
         """
         Initialize message.
@@ -67,7 +127,8 @@ class AIAssistant:
         """
         self.llm_client = llm_client or create_llm_client(fallback=True)
         self.temperature = temperature
-        self.conversation_history: List[AIMessage] = []
+        self.conversation_history: Deque[AIMessage] = deque(maxlen=MAX_HISTORY_MESSAGES)
+        self._recent_messages: Deque[AIMessage] = deque(maxlen=PROMPT_HISTORY_MESSAGES)
         
         logger.info(f"AIAssistant initialized with temperature={temperature}")
     
@@ -95,7 +156,7 @@ class AIAssistant:
         
         # Add user message to history
         user_message = AIMessage("user", question)
-        self.conversation_history.append(user_message)
+        self._add_message(user_message)
         
         # Build context from RFP, requirements, and risks
         context = self._build_context(rfp, requirements, risks, page_context)
@@ -104,7 +165,7 @@ class AIAssistant:
         prompt = get_ai_assistant_prompt(
             question=question,
             context=context,
-            conversation_history=self.conversation_history[-5:],  # Last 5 messages for context
+            conversation_history=tuple(self._recent_messages),
             page_context=page_context
         )
         
@@ -117,7 +178,7 @@ class AIAssistant:
             
             # Add assistant message to history
             assistant_message = AIMessage("assistant", response)
-            self.conversation_history.append(assistant_message)
+            self._add_message(assistant_message)
             
             logger.info(f"Generated response: {len(response)} characters")
             return response
@@ -125,9 +186,14 @@ class AIAssistant:
         except Exception as e:
             logger.error(f"Error generating response: {e}")
             error_msg = "I apologize, but I encountered an error while processing your question. Please try again or rephrase your question."
-            self.conversation_history.append(AIMessage("assistant", error_msg))
+            self._add_message(AIMessage("assistant", error_msg))
             return error_msg
     
+    def _add_message(self, message: AIMessage) -> None:
+        """Record a message in the bounded history and the prompt window."""
+        self.conversation_history.append(message)
+        self._recent_messages.append(message)
+    
     def _build_context(
         self,
         rfp: Optional[RFP],
@@ -166,29 +232,26 @@ class AIAssistant:
         
         if requirements:
             context["requirements_count"] = len(requirements)
-            # Summarize requirements by category
-            by_category = {}
-            for req in requirements:
-                cat = req.category.value if hasattr(req.category, 'value') else str(req.category)
-                by_category[cat] = by_category.get(cat, 0) + 1
+            # Summarize requirements by category (Counter counts in C);
+            # Requirement.__post_init__ guarantees enum-typed categories
+            by_category = Counter(req.category.value for req in requirements)
             context["requirements_summary"] = ", ".join(
                 [f"{count} {cat}" for cat, count in by_category.items()]
             )
         
         if risks:
             context["risks_count"] = len(risks)
-            # Summarize risks by severity
-            by_severity = {}
-            critical_risks = []
-            for risk in risks:
-                sev = risk.severity.value if hasattr(risk.severity, 'value') else str(risk.severity)
-                by_severity[sev] = by_severity.get(sev, 0) + 1
-                if sev == "critical":
-                    critical_risks.append({
-                        "clause": risk.clause_text[:100],
-                        "category": risk.category.value if hasattr(risk.category, 'value') else str(risk.category),
-                        "recommendation": risk.recommendation[:150]
-                    })
+            # Summarize risks by severity (Counter counts in C)
+            by_severity = Counter(risk.severity.value for risk in risks)
+            critical_risks = [
+                {
+                    "clause": risk.clause_text[:100],
+                    "category": risk.category.value,
+                    "recommendation": risk.recommendation[:150]
+                }
+                for risk in risks
+                if risk.severity is RiskSeverity.CRITICAL
+            ]
             context["risks_summary"] = ", ".join(
                 [f"{count} {sev}" for sev, count in by_severity.items()]
             )
@@ -198,68 +261,7 @@ class AIAssistant:
     
     def _get_page_help(self, page_context: str) -> str:
         """Get help text for the current page."""
-        page_help_texts = {
-            "upload": """
-**Upload RFP Page:**
-- Upload PDF files up to 50MB
-- Provide RFP title, client name, deadline, and optional notes
-- The system will extract text from the PDF automatically
-- After upload, navigate to Requirements or Risk Analysis pages
-- Supported formats: PDF only
-            """,
-            "requirements": """
-**Requirements Extraction Page:**
-- Extract requirements using AI or manual entry
-- Filter by category (Technical, Functional, Timeline, Budget, Compliance)
-- Filter by priority (Critical, High, Medium, Low)
-- Edit, delete, or verify requirements
-- Export requirements to JSON or CSV
-- Import requirements from JSON files
-- Requirements are linked to specific pages in the RFP
-            """,
-            "service_matching": """
-**Service Matching Page:**
-- Automatically match RFP requirements to BairesDev services
-- Uses TF-IDF vectorization and cosine similarity for matching
-- View match scores (🟢 >80%, 🟡 50-80%, 🔴 <50%)
-- Filter matches by category and minimum score threshold
-- Approve high-confidence matches (>80%) for draft generation
-- View coverage by requirement category with bar chart
-- Export matches to JSON for reference
-- Approved matches are automatically included in proposal drafts
-- Prerequisites: RFP uploaded, requirements extracted
-            """,
-            "risks": """
-**Risk Analysis Page:**
-- Detect risks using pattern matching or AI
-- Filter by category (Legal, Financial, Timeline, Technical, Compliance)
-- Filter by severity (Critical, High, Medium, Low)
-- Acknowledge risks with notes
-- View recommendations and alternative language suggestions
-- Export risks to JSON or CSV
-- Import risks from JSON files
-- Critical risks may block draft generation
-            """,
-            "draft": """
-**Draft Generation Page:**
-- Generate proposal drafts with customizable instructions
-- Specify word count, tone, and style preferences
-- Edit drafts directly in the app with real-time preview
-- Regenerate specific sections without regenerating the entire draft
-- Export drafts to Markdown or JSON
-- Approved service matches (>80%) are automatically included
-- Prerequisites: RFP uploaded, requirements extracted, risks acknowledged
-            """,
-            "main": """
-**Main Page:**
-- Overview of the RFP Draft Booster application
-- Use Global Search to find content across all pages
-- View Progress Dashboard to track completion status
-- Navigate to different pages using the sidebar
-- This is the starting point for processing RFPs
-            """
-        }
-        return page_help_texts.get(page_context, "")
+        return _PAGE_HELP.get(page_context, "")
     
     def _clean_response(self, response: str) -> str:
         """
@@ -271,26 +273,35 @@ class AIAssistant:
         Returns:
             Cleaned response
         """
-        # Remove markdown code blocks if present
-        if response.startswith("```"):
-            lines = response.split("\n")
-            # Remove first line (```) and last line (```)
-            if len(lines) > 2:
-                response = "\n".join(lines[1:-1])
-        
-        # Remove leading/trailing whitespace
         response = response.strip()
         
+        # Remove markdown code fence if present: drop the opening ``` line
+        # and everything from the closing ``` on, without splitting lines
+        if response.startswith("```"):
+            first_newline = response.find("\n")
+            closing_fence = response.rfind("```")
+            if first_newline != -1 and closing_fence > first_newline:
+                response = response[first_newline + 1:closing_fence].strip()
+        
         return response
     
     def clear_history(self) -> None:
         """Clear conversation history."""
-        self.conversation_history = []
+        self.conversation_history.clear()
+        self._recent_messages.clear()
         logger.info("Conversation history cleared")
     
-    def get_history(self) -> List[Dict[str, Any]]:
-        """Get conversation history as list of dictionaries."""
-        return [msg.to_dict() for msg in self.conversation_history]
+    def get_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get conversation history as list of dictionaries.
+        
+        Args:
+            limit: Only convert the most recent `limit` messages (all if None)
+        """
+        messages = self.conversation_history
+        if limit is not None:
+            messages = islice(messages, max(len(messages) - limit, 0), None)
+        return [msg.to_dict() for msg in messages]
     
     def get_last_response(self) -> Optional[str]:
         """Get the last assistant response."""
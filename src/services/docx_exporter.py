@@ -7,6 +7,7 @@ with automatic formatting.
 import logging
 import re
 from datetime import datetime
+from functools import lru_cache
 from io import BytesIO
 from typing import Optional, List, Dict, Any
 
@@ -26,6 +27,23 @@ from src.models.rfp import RFP
 
 logger = logging.getLogger(__name__)
 
+# One alternation per inline style: **bold**, *italic*, `code`, then plain text.
+# A stray '*' or '`' that does not close falls through as plain text.
+_INLINE_RE = re.compile(r'\*\*(.+?)\*\*|\*(.+?)\*|`(.+?)`|([^*`]+|[*`])')
+
+# Markdown line prefixes: heading markers map to their level
+_HEADING_LEVELS = {'#': 1, '##': 2, '###': 3, '####': 4}
+_BULLET_MARKERS = frozenset({'-', '*'})
+_NUMBERED_ITEM_RE = re.compile(r'\d+\.\s')
+
+
+@lru_cache(maxsize=1)
+def _blank_document_bytes() -> bytes:
+    """Serialized blank document, so later exports skip reading default.docx."""
+    buffer = BytesIO()
+    Document().save(buffer)
+    return buffer.getvalue()
+
 
 class DocxExporter:
     """Export drafts to .docx format.
@@ -73,8 +91,8 @@ class DocxExporter:
         try:
             logger.debug("Generating .docx file")
             
-            # Create document
-            doc = Document()
+            # Create document from the cached blank template
+            doc = Document(BytesIO(_blank_document_bytes()))
             
             # Add title
             title = self._generate_doc_title(draft, rfp)
@@ -185,41 +203,33 @@ class DocxExporter:
             doc: Document object
             content: Markdown content
         """
-        lines = content.split('\n')
-        i = 0
-        
-        while i < len(lines):
-            line = lines[i].rstrip()
+        for line in content.split('\n'):
+            line = line.rstrip()
             
-            # Skip empty lines
+            # Empty lines become spacing paragraphs
             if not line:
                 doc.add_paragraph()
-                i += 1
                 continue
             
+            marker, separator, rest = line.partition(' ')
+            level = _HEADING_LEVELS.get(marker) if separator else None
+            
             # Headings
-            if line.startswith('# '):
-                doc.add_heading(line[2:], level=1)
-            elif line.startswith('## '):
-                doc.add_heading(line[3:], level=2)
-            elif line.startswith('### '):
-                doc.add_heading(line[4:], level=3)
-            elif line.startswith('#### '):
-                doc.add_heading(line[5:], level=4)
+            if level:
+                doc.add_heading(rest, level=level)
             
             # Lists
-            elif line.startswith('- ') or line.startswith('* '):
-                para = doc.add_paragraph(line[2:], style='List Bullet')
-            elif re.match(r'^\d+\.\s', line):
-                text = re.sub(r'^\d+\.\s', '', line)
-                para = doc.add_paragraph(text, style='List Number')
-            
-            # Regular paragraph with inline formatting
+            elif separator and marker in _BULLET_MARKERS:
+                doc.add_paragraph(rest, style='List Bullet')
             else:
-                para = doc.add_paragraph()
-                self._add_inline_formatting(para, line)
-            
-            i += 1
+                numbered = _NUMBERED_ITEM_RE.match(line)
+                if numbered:
+                    doc.add_paragraph(line[numbered.end():], style='List Number')
+                
+                # Regular paragraph with inline formatting
+                else:
+                    para = doc.add_paragraph()
+                    self._add_inline_formatting(para, line)
     
     def _add_inline_formatting(self, paragraph, text: str):
         """Add text with inline formatting (bold, italic) to paragraph.
@@ -228,34 +238,13 @@ class DocxExporter:
             paragraph: Paragraph object
             text: Text with markdown formatting
         """
-        # Simple regex-based inline formatting
-        # Handle **bold**, *italic*, and `code`
-        
-        # Replace **bold**
-        pattern = r'\*\*(.+?)\*\*'
-        parts = re.split(pattern, text)
-        
-        for i, part in enumerate(parts):
-            if i % 2 == 0:
-                # Regular text, check for *italic*
-                italic_pattern = r'\*(.+?)\*'
-                italic_parts = re.split(italic_pattern, part)
-                for j, italic_part in enumerate(italic_parts):
-                    if j % 2 == 0:
-                        # Regular text, check for `code`
-                        code_pattern = r'`(.+?)`'
-                        code_parts = re.split(code_pattern, italic_part)
-                        for k, code_part in enumerate(code_parts):
-                            if k % 2 == 0:
-                                if code_part:
-                                    paragraph.add_run(code_part)
-                            else:
-                                run = paragraph.add_run(code_part)
-                                run.font.name = 'Courier New'
-                    else:
-                        run = paragraph.add_run(italic_part)
-                        run.italic = True
+        for match in _INLINE_RE.finditer(text):
+            bold, italic, code, plain = match.groups()
+            if bold is not None:
+                paragraph.add_run(bold).bold = True
+            elif italic is not None:
+                paragraph.add_run(italic).italic = True
+            elif code is not None:
+                paragraph.add_run(code).font.name = 'Courier New'
             else:
-                run = paragraph.add_run(part)
-                run.bold = True
-
+                paragraph.add_run(plain)
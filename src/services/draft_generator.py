@@ -6,15 +6,16 @@ requirements, service matches, and risks using LLM-powered content generation.
 """
 
 import logging
-import re
 import time
-from typing import List, Optional, Dict, Any
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional, Dict, Any
 from datetime import datetime
 
 from models import RFP, Requirement, Risk, Draft, DraftSection, DraftStatus, GenerationMethod
 from services.llm_client import LLMClient, create_llm_client
 from utils.prompt_templates import (
-    get_draft_generation_prompt,
+    get_section_generation_prompt,
     get_section_regeneration_prompt
 )
 
@@ -43,10 +44,17 @@ class DraftGenerator:
         {"type": "risk_mitigation", "title": "Risk Mitigation", "order": 6, "word_count": 300},
     ]
     
+    # Sum of the standard section word counts; requested totals scale from this
+    STANDARD_WORD_COUNT = sum(s["word_count"] for s in STANDARD_SECTIONS)
+    
+    # Standard section configs indexed by section type
+    _SECTIONS_BY_TYPE = {s["type"]: s for s in STANDARD_SECTIONS}
+    
     def __init__(
         self,
         llm_client: Optional[LLMClient] = None,
         temperature: float = 0.7,
+        max_concurrency: int = 4,
     ):
         """
         Initialize draft generator.
@@ -54,9 +62,15 @@ class DraftGenerator:
         Args:
             llm_client: LLM client to use (creates default if not provided)
             temperature: Generation temperature (0.0-1.0)
+            max_concurrency: Maximum LLM calls in flight when generating
+                several sections at once (keeps provider rate limits happy)
         """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        
         self.llm_client = llm_client or create_llm_client(fallback=True)
         self.temperature = temperature
+        self.max_concurrency = max_concurrency
         
         logger.info(f"DraftGenerator initialized with temperature={temperature}")
     
@@ -72,10 +86,15 @@ class DraftGenerator:
         word_count: int = 2000,
         min_word_count: int = 500,
         max_word_count: int = 10000,
+        on_section: Optional[Callable[[DraftSection], None]] = None,
     ) -> Draft:
         """
         Generate complete proposal draft.
         
+        Each standard section is written by its own LLM call; the calls run
+        concurrently (up to `max_concurrency`) and the draft is assembled
+        from the results in section order.
+        
         Args:
             rfp: RFP object
             requirements: List of requirements
@@ -87,6 +106,8 @@ class DraftGenerator:
             word_count: Target word count
             min_word_count: Minimum word count (default 500)
             max_word_count: Maximum word count (default 10000)
+            on_section: Called in the caller's thread with each section as
+                soon as it is generated (completion order), e.g. to show progress
             
         Returns:
             Generated Draft object
@@ -111,36 +132,38 @@ class DraftGenerator:
         logger.info(f"Starting draft generation for RFP: {rfp.id}")
         start_time = time.time()
         
-        # Build summaries
-        rfp_info = self._build_rfp_info(rfp)
-        requirements_summary = self._build_requirements_summary(requirements)
-        service_matches_summary = self._build_service_matches_summary(service_matches or [])
-        risks_summary = self._build_risks_summary(risks)
-        
-        # Generate prompt
-        prompt = get_draft_generation_prompt(
-            rfp_info=rfp_info,
-            requirements_summary=requirements_summary,
-            service_matches=service_matches_summary,
-            risks_summary=risks_summary,
-            instructions=instructions,
-            tone=tone,
-            audience=audience,
-            word_count=word_count
-        )
+        # Build summaries and one prompt per standard section
+        prompt_context = self._build_prompt_context(rfp, requirements, risks, service_matches)
+        prompts = [
+            get_section_generation_prompt(
+                section_type=config["type"],
+                section_title=config["title"],
+                instructions=instructions,
+                tone=tone,
+                audience=audience,
+                word_count=self._section_word_count(config, word_count),
+                **prompt_context
+            )
+            for config in self.STANDARD_SECTIONS
+        ]
         
         try:
-            # Generate draft content
-            draft_content = self.llm_client.generate(prompt, temperature=self.temperature)
+            # Generate all sections concurrently and assemble the draft
+            sections: List[Optional[DraftSection]] = [None] * len(prompts)
             
-            # Clean and parse content
-            draft_content = self._clean_draft_content(draft_content)
+            def collect(index: int, content: str) -> None:
+                section = self._build_generated_section(self.STANDARD_SECTIONS[index], content)
+                sections[index] = section
+                if on_section:
+                    on_section(section)
             
-            # Parse sections from content
-            sections = self._parse_sections(draft_content)
+            self._generate_concurrently(prompts, on_result=collect)
+            draft_content = "\n\n".join(
+                f"## {section.title}\n\n{section.content}" for section in sections
+            )
             
-            # Calculate metrics
-            total_word_count = len(draft_content.split())
+            # Calculate metrics; sections already counted their own words
+            total_word_count = sum(section.word_count for section in sections)
             generation_time = time.time() - start_time
             
             # Create Draft object
@@ -200,50 +223,16 @@ class DraftGenerator:
         """
         logger.info(f"Regenerating section: {section_type}")
         
-        # Find section
-        section = draft.get_section_by_type(section_type)
-        if not section:
-            raise ValueError(f"Section {section_type} not found in draft")
-        
-        # Get other sections for context
-        other_sections = self._get_other_sections_content(draft, section_type)
-        
-        # Build summaries
-        rfp_info = self._build_rfp_info(rfp)
-        requirements_summary = self._build_requirements_summary(requirements)
-        service_matches_summary = self._build_service_matches_summary(service_matches or [])
-        risks_summary = self._build_risks_summary(risks)
-        
-        # Find section config
-        section_config = next(
-            (s for s in self.STANDARD_SECTIONS if s["type"] == section_type),
-            {"title": section.title, "word_count": 300}
-        )
-        
-        # Generate prompt
-        prompt = get_section_regeneration_prompt(
-            section_type=section_type,
-            section_title=section_config["title"],
-            rfp_info=rfp_info,
-            requirements_summary=requirements_summary,
-            service_matches=service_matches_summary,
-            risks_summary=risks_summary,
-            other_sections=other_sections,
-            instructions=instructions,
-            tone=tone,
-            audience=audience,
-            word_count=section_config.get("word_count", 300)
+        section = self._find_section(draft, section_type)
+        prompt_context = self._build_prompt_context(rfp, requirements, risks, service_matches)
+        prompt = self._build_section_prompt(
+            draft, section, prompt_context, instructions, tone, audience
         )
         
         try:
             # Generate section content
             section_content = self.llm_client.generate(prompt, temperature=self.temperature)
-            section_content = self._clean_draft_content(section_content)
-            
-            # Update section
-            section.content = section_content
-            section.word_count = len(section_content.split())
-            section.user_edited = False  # Reset since regenerated
+            self._apply_section_content(section, section_content)
             
             logger.info(f"Section {section_type} regenerated: {section.word_count} words")
             
@@ -253,6 +242,188 @@ class DraftGenerator:
             logger.error(f"Error regenerating section: {e}")
             raise
     
+    def regenerate_sections(
+        self,
+        draft: Draft,
+        section_types: List[str],
+        rfp: RFP,
+        requirements: List[Requirement],
+        risks: List[Risk],
+        service_matches: Optional[List[Any]] = None,
+        instructions: str = "",
+        tone: str = "professional",
+        audience: str = "enterprise",
+    ) -> List[DraftSection]:
+        """
+        Regenerate several sections of the draft concurrently.
+        
+        LLM calls are blocking network I/O, so the prompts run on a thread
+        pool of at most `max_concurrency` workers and total wall-clock time
+        approaches the slowest call rather than the sum. Every prompt sees
+        the other sections as they were before this batch started.
+        
+        Args:
+            draft: Current draft
+            section_types: Types of the sections to regenerate
+            rfp: RFP object
+            requirements: List of requirements
+            risks: List of risks
+            service_matches: List of service matches (optional)
+            instructions: Custom instructions
+            tone: Writing tone
+            audience: Target audience
+            
+        Returns:
+            Updated DraftSections, in the order of `section_types`
+        """
+        logger.info(f"Regenerating {len(section_types)} sections: {', '.join(section_types)}")
+        
+        # Resolve every section before spending any LLM calls
+        sections = [self._find_section(draft, section_type) for section_type in section_types]
+        if not sections:
+            return []
+        
+        prompt_context = self._build_prompt_context(rfp, requirements, risks, service_matches)
+        prompts = [
+            self._build_section_prompt(draft, section, prompt_context, instructions, tone, audience)
+            for section in sections
+        ]
+        
+        try:
+            contents = self._generate_concurrently(prompts)
+        except Exception as e:
+            logger.error(f"Error regenerating sections: {e}")
+            raise
+        
+        for section, content in zip(sections, contents):
+            self._apply_section_content(section, content)
+        
+        logger.info(f"Regenerated {len(sections)} sections")
+        return sections
+    
+    def _generate_concurrently(
+        self,
+        prompts: List[str],
+        on_result: Optional[Callable[[int, str], None]] = None,
+    ) -> List[str]:
+        """
+        Run LLM calls for several prompts on a bounded thread pool.
+        
+        On the first failure, calls that have not started are cancelled and
+        the error propagates once running calls finish.
+        
+        Args:
+            prompts: Prompts to send
+            on_result: Called in the caller's thread with (prompt index,
+                response) as each call completes
+        
+        Returns:
+            Responses in the order of `prompts`
+        """
+        results: List[Optional[str]] = [None] * len(prompts)
+        workers = min(self.max_concurrency, len(prompts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._generate_text, prompt): index
+                for index, prompt in enumerate(prompts)
+            }
+            try:
+                for future in as_completed(futures):
+                    index = futures[future]
+                    results[index] = future.result()
+                    if on_result:
+                        on_result(index, results[index])
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return results
+    
+    def _generate_text(self, prompt: str) -> str:
+        """Run one LLM call at the generator's temperature."""
+        return self.llm_client.generate(prompt, temperature=self.temperature)
+    
+    def _section_word_count(self, section_config: Dict[str, Any], word_count: int) -> int:
+        """Scale a standard section's word count to the requested draft total."""
+        return max(50, round(section_config["word_count"] * word_count / self.STANDARD_WORD_COUNT))
+    
+    def _build_generated_section(self, section_config: Dict[str, Any], content: str) -> DraftSection:
+        """Create a DraftSection from one section's LLM response."""
+        content = self._clean_draft_content(content)
+        
+        # Models often repeat the section heading despite the prompt; other
+        # leading headings (e.g. "### Phase 1") are real content and stay
+        first_line, _, rest = content.partition("\n")
+        if first_line.startswith("#"):
+            heading = first_line.lstrip("#").strip()
+            if heading.lower() == section_config["title"].lower():
+                content = rest.strip()
+        
+        return DraftSection(
+            section_type=section_config["type"],
+            title=section_config["title"],
+            content=content,
+            word_count=len(content.split()),
+            order=section_config["order"],
+            generated_by="ai"
+        )
+    
+    def _find_section(self, draft: Draft, section_type: str) -> DraftSection:
+        """Return the draft section of the given type, or raise ValueError."""
+        section = draft.get_section_by_type(section_type)
+        if not section:
+            raise ValueError(f"Section {section_type} not found in draft")
+        return section
+    
+    def _build_prompt_context(
+        self,
+        rfp: RFP,
+        requirements: List[Requirement],
+        risks: List[Risk],
+        service_matches: Optional[List[Any]],
+    ) -> Dict[str, str]:
+        """Build the RFP, requirements, service and risk summaries shared by all prompts."""
+        return {
+            "rfp_info": self._build_rfp_info(rfp),
+            "requirements_summary": self._build_requirements_summary(requirements),
+            "service_matches": self._build_service_matches_summary(service_matches or []),
+            "risks_summary": self._build_risks_summary(risks),
+        }
+    
+    def _build_section_prompt(
+        self,
+        draft: Draft,
+        section: DraftSection,
+        prompt_context: Dict[str, str],
+        instructions: str,
+        tone: str,
+        audience: str,
+    ) -> str:
+        """Build the regeneration prompt for one section."""
+        section_type = section.section_type
+        
+        # Find section config
+        section_config = self._SECTIONS_BY_TYPE.get(section_type)
+        if section_config is None:
+            section_config = {"title": section.title, "word_count": 300}
+        
+        return get_section_regeneration_prompt(
+            section_type=section_type,
+            section_title=section_config["title"],
+            other_sections=self._get_other_sections_content(draft, section_type),
+            instructions=instructions,
+            tone=tone,
+            audience=audience,
+            word_count=section_config.get("word_count", 300),
+            **prompt_context
+        )
+    
+    def _apply_section_content(self, section: DraftSection, content: str) -> None:
+        """Store regenerated content on a section."""
+        section.content = self._clean_draft_content(content)
+        section.word_count = len(section.content.split())
+        section.user_edited = False  # Reset since regenerated
+    
     def _build_rfp_info(self, rfp: RFP) -> str:
         """Build RFP information summary."""
         parts = []
@@ -270,13 +441,10 @@ class DraftGenerator:
         if not requirements:
             return "No requirements extracted yet."
         
-        # Group by category
-        by_category = {}
+        # Group by category (Requirement guarantees enum-typed categories)
+        by_category: Dict[str, List[str]] = defaultdict(list)
         for req in requirements:
-            cat = req.category.value if hasattr(req.category, 'value') else str(req.category)
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(req.description)
+            by_category[req.category.value].append(req.description)
         
         summary_parts = [f"Total Requirements: {len(requirements)}"]
         for cat, descs in by_category.items():
@@ -328,27 +496,20 @@ class DraftGenerator:
         if not risks:
             return "No risks detected."
         
-        # Group by severity
-        by_severity = {}
+        # Group by severity; only the top 3 per severity are formatted below
+        by_severity: Dict[str, List[Risk]] = defaultdict(list)
         for risk in risks:
-            sev = risk.severity.value if hasattr(risk.severity, 'value') else str(risk.severity)
-            if sev not in by_severity:
-                by_severity[sev] = []
-            by_severity[sev].append({
-                "clause": risk.clause_text[:100],
-                "category": risk.category.value if hasattr(risk.category, 'value') else str(risk.category),
-                "recommendation": risk.recommendation[:150]
-            })
+            by_severity[risk.severity.value].append(risk)
         
         summary_parts = [f"Total Risks Detected: {len(risks)}"]
         for sev in ["critical", "high", "medium", "low"]:
             if sev in by_severity:
                 risks_list = by_severity[sev]
                 summary_parts.append(f"\n{sev.capitalize()} Risks ({len(risks_list)}):")
-                for risk_info in risks_list[:3]:  # Top 3 per severity
+                for risk in risks_list[:3]:  # Top 3 per severity
                     summary_parts.append(
-                        f"- {risk_info['clause']}... ({risk_info['category']}): "
-                        f"{risk_info['recommendation']}"
+                        f"- {risk.clause_text[:100]}... ({risk.category.value}): "
+                        f"{risk.recommendation[:150]}"
                     )
         
         return "\n".join(summary_parts)
@@ -368,90 +529,6 @@ class DraftGenerator:
         
         return content
     
-    def _parse_sections(self, content: str) -> List[DraftSection]:
-        """
-        Parse draft content into sections.
-        
-        Looks for markdown headings (# Title) and creates sections.
-        """
-        sections = []
-        lines = content.split("\n")
-        
-        current_section = None
-        current_content = []
-        
-        for line in lines:
-            # Check for markdown heading (## or ###)
-            heading_match = re.match(r'^#{2,3}\s+(.+)$', line.strip())
-            if heading_match:
-                # Save previous section
-                if current_section:
-                    current_section.content = "\n".join(current_content).strip()
-                    current_section.word_count = len(current_section.content.split())
-                    sections.append(current_section)
-                
-                # Start new section
-                title = heading_match.group(1).strip()
-                section_type = self._map_title_to_section_type(title)
-                current_section = DraftSection(
-                    section_type=section_type,
-                    title=title,
-                    order=len(sections) + 1,
-                    generated_by="ai"
-                )
-                current_content = []
-            else:
-                if current_section:
-                    current_content.append(line)
-                else:
-                    # Content before first heading goes to executive summary
-                    if not current_section:
-                        current_section = DraftSection(
-                            section_type="executive_summary",
-                            title="Executive Summary",
-                            order=1,
-                            generated_by="ai"
-                        )
-                    current_content.append(line)
-        
-        # Save last section
-        if current_section:
-            current_section.content = "\n".join(current_content).strip()
-            current_section.word_count = len(current_section.content.split())
-            sections.append(current_section)
-        
-        # If no sections found, create one section with all content
-        if not sections:
-            sections.append(DraftSection(
-                section_type="executive_summary",
-                title="Executive Summary",
-                content=content,
-                word_count=len(content.split()),
-                order=1,
-                generated_by="ai"
-            ))
-        
-        return sections
-    
-    def _map_title_to_section_type(self, title: str) -> str:
-        """Map section title to section type."""
-        title_lower = title.lower()
-        
-        if "executive" in title_lower or "summary" in title_lower:
-            return "executive_summary"
-        elif "approach" in title_lower or "methodology" in title_lower:
-            return "approach"
-        elif "service" in title_lower or "solution" in title_lower:
-            return "services"
-        elif "timeline" in title_lower or "schedule" in title_lower:
-            return "timeline"
-        elif "pricing" in title_lower or "cost" in title_lower or "price" in title_lower:
-            return "pricing"
-        elif "risk" in title_lower or "mitigation" in title_lower:
-            return "risk_mitigation"
-        else:
-            return "other"
-    
     def _get_other_sections_content(self, draft: Draft, exclude_type: str) -> str:
         """Get content of other sections for context."""
         other_sections = [s for s in draft.sections if s.section_type != exclude_type]
@@ -1,9 +1,10 @@
 """File validation service."""
 
+import hashlib
 import logging
-import mimetypes
+import os
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 import io
 
 logger = logging.getLogger(__name__)
@@ -16,14 +17,16 @@ class FileValidator:
     MAX_FILE_SIZE_MB = 50
     MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
     ALLOWED_EXTENSIONS = {".pdf"}
-    ALLOWED_MIME_TYPES = {"application/pdf", "application/x-pdf"}
+    _ALLOWED_SUFFIXES = tuple(ALLOWED_EXTENSIONS)  # str.endswith needs a tuple
+    PDF_MAGIC = b"%PDF-"  # Every PDF file starts with this header
+    HASH_CHUNK_SIZE = 1 << 20  # 1MB reads when hashing a stream
 
     @classmethod
     def validate_file(
         cls,
         file_name: str,
         file_size: int,
-        file_content: Optional[io.BytesIO] = None
+        file_content: Optional[Union[io.BytesIO, bytes, memoryview]] = None
     ) -> Tuple[bool, Optional[str]]:
         """
         Validate uploaded file.
@@ -31,7 +34,8 @@ class FileValidator:
         Args:
             file_name: Name of the file
             file_size: Size of file in bytes
-            file_content: Optional file content for deeper validation
+            file_content: Optional file content (stream or raw bytes) for
+                deeper validation
 
         Returns:
             Tuple of (is_valid, error_message)
@@ -46,8 +50,8 @@ class FileValidator:
         if not valid:
             return valid, error
 
-        # Validate MIME type if content provided
-        if file_content:
+        # Validate file signature if content provided
+        if file_content is not None:
             valid, error = cls._validate_mime_type(file_name, file_content)
             if not valid:
                 return valid, error
@@ -56,20 +60,71 @@ class FileValidator:
         return True, None
 
     @classmethod
-    def _validate_extension(cls, file_name: str) -> Tuple[bool, Optional[str]]:
-        """Validate file extension."""
-        file_path = Path(file_name)
-        extension = file_path.suffix.lower()
+    def validate_and_hash(
+        cls,
+        file_name: str,
+        file_size: int,
+        file_content: Union[io.BytesIO, bytes, memoryview]
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
+        """
+        Validate uploaded file and compute its SHA-256 digest.
 
-        if extension not in cls.ALLOWED_EXTENSIONS:
-            error_msg = (
-                f"Invalid file type. Only PDF files are supported. "
-                f"Your file: {extension or 'no extension'}"
-            )
-            logger.warning(f"Invalid extension: {extension} for file: {file_name}")
-            return False, error_msg
+        The digest identifies identical uploads, so a file that was already
+        processed can reuse its extraction results.
 
-        return True, None
+        Args:
+            file_name: Name of the file
+            file_size: Size of file in bytes
+            file_content: File content (stream or raw bytes)
+
+        Returns:
+            Tuple of (is_valid, error_message, hex_digest); the digest is
+            None when validation fails
+        """
+        valid, error = cls.validate_file(file_name, file_size, file_content)
+        if not valid:
+            return valid, error, None
+
+        return True, None, cls._hash_content(file_content)
+
+    @classmethod
+    def validate_path(cls, path: Union[str, Path]) -> Tuple[bool, Optional[str]]:
+        """
+        Validate a file on disk without loading it into memory.
+
+        Only the file size (from stat) and the signature bytes are read.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        path = Path(path)
+        try:
+            file_size = path.stat().st_size
+            with path.open("rb") as f:
+                header = f.read(len(cls.PDF_MAGIC))
+        except OSError as e:
+            logger.warning(f"Cannot read file for validation: {path}: {e}")
+            return False, f"Cannot read file: {path.name}"
+
+        return cls.validate_file(path.name, file_size, header)
+
+    @classmethod
+    def _validate_extension(cls, file_name: str) -> Tuple[bool, Optional[str]]:
+        """Validate file extension."""
+        if file_name.lower().endswith(cls._ALLOWED_SUFFIXES):
+            return True, None
+
+        # Only the error message needs the actual extension
+        extension = os.path.splitext(file_name)[1].lower()
+        error_msg = (
+            f"Invalid file type. Only PDF files are supported. "
+            f"Your file: {extension or 'no extension'}"
+        )
+        logger.warning(f"Invalid extension: {extension} for file: {file_name}")
+        return False, error_msg
 
     @classmethod
     def _validate_size(cls, file_size: int) -> Tuple[bool, Optional[str]]:
@@ -92,29 +147,43 @@ class FileValidator:
     def _validate_mime_type(
         cls,
         file_name: str,
-        file_content: io.BytesIO
+        file_content: Union[io.BytesIO, bytes, memoryview]
     ) -> Tuple[bool, Optional[str]]:
-        """Validate MIME type."""
-        # Guess MIME type from extension
-        mime_type, _ = mimetypes.guess_type(file_name)
-
-        if mime_type not in cls.ALLOWED_MIME_TYPES:
-            # Check file magic bytes for PDF signature
+        """Validate the PDF signature in the file header.
+        
+        The extension was already checked, so guessing a MIME type from the
+        name adds nothing; only the magic bytes say what the content is.
+        """
+        if isinstance(file_content, (bytes, memoryview)):
+            header = bytes(file_content[:len(cls.PDF_MAGIC)])
+        else:
             file_content.seek(0)
-            header = file_content.read(4)
+            header = file_content.read(len(cls.PDF_MAGIC))
             file_content.seek(0)
 
-            # PDF files start with %PDF
-            if not header.startswith(b'%PDF'):
-                error_msg = (
-                    "File does not appear to be a valid PDF. "
-                    f"Detected type: {mime_type or 'unknown'}"
-                )
-                logger.warning(f"Invalid MIME type: {mime_type} for file: {file_name}")
-                return False, error_msg
+        if header != cls.PDF_MAGIC:
+            error_msg = (
+                "File does not appear to be a valid PDF "
+                "(missing %PDF- header)."
+            )
+            logger.warning(f"Invalid PDF signature {header!r} for file: {file_name}")
+            return False, error_msg
 
         return True, None
 
+    @classmethod
+    def _hash_content(cls, file_content: Union[io.BytesIO, bytes, memoryview]) -> str:
+        """Return the SHA-256 hex digest of the content, rewinding streams."""
+        if isinstance(file_content, (bytes, memoryview)):
+            return hashlib.sha256(file_content).hexdigest()
+
+        digest = hashlib.sha256()
+        file_content.seek(0)
+        for chunk in iter(lambda: file_content.read(cls.HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        file_content.seek(0)
+        return digest.hexdigest()
+
     @classmethod
     def format_file_size(cls, size_bytes: int) -> str:
         """Format file size for display."""
@@ -5,8 +5,12 @@ This module provides a unified interface for interacting with different LLM prov
 (Gemini, Groq, Ollama) for requirement extraction from RFPs.
 """
 
+import importlib
 import json
 import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
 
@@ -18,12 +22,36 @@ except ImportError:
     # python-dotenv not installed, but that's okay if env vars are set another way
     pass
 
+# orjson is optional; it decodes several times faster than the stdlib parser
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from src.utils.logger import setup_logger
 from src.utils.error_handler import LLMError
 from src.utils.retry_utils import retry_llm_call
 
 logger = setup_logger(__name__)
 
+# Responses are only cached at or below this temperature, where output is
+# (near-)deterministic and a repeated prompt should get the same answer
+CACHEABLE_TEMPERATURE = 0.1
+RESPONSE_CACHE_SIZE = 128  # 0 disables the cache
+
+# Process-wide LRU of (provider, model, temperature, max_tokens, prompt) ->
+# response. Pages build a new LLMClient per action, so a per-instance cache
+# would never see the same prompt twice.
+_response_cache: "OrderedDict[Tuple[str, str, float, int, str], str]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def clear_response_cache() -> None:
+    """Drop all cached LLM responses."""
+    with _response_cache_lock:
+        _response_cache.clear()
+
 
 class LLMProvider(str, Enum):
     """Supported LLM providers."""
@@ -32,6 +60,44 @@ class LLMProvider(str, Enum):
     OLLAMA = "ollama"
 
 
+_DEFAULT_MODELS = {
+    LLMProvider.GEMINI: "gemini-2.5-flash",  # Fast and efficient model
+    LLMProvider.GROQ: "mixtral-8x7b-32768",
+    LLMProvider.OLLAMA: "llama2",
+}
+
+# SDK module and pip package name per provider
+_PROVIDER_PACKAGES = {
+    LLMProvider.GEMINI: ("google.generativeai", "google-generativeai"),
+    LLMProvider.GROQ: ("groq", "groq"),
+    LLMProvider.OLLAMA: ("ollama", "ollama"),
+}
+
+# Environment variable holding the API key, for providers that need one
+_PROVIDER_API_KEY_ENV = {
+    LLMProvider.GEMINI: "GEMINI_API_KEY",
+    LLMProvider.GROQ: "GROQ_API_KEY",
+}
+
+
+# Groq SDK clients kept alive at once; keys may come from user input, so
+# the least recently used client (and its connection pool) is dropped
+_GROQ_CLIENT_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=_GROQ_CLIENT_CACHE_SIZE)
+def _shared_groq_client(groq_cls, api_key: str):
+    """
+    Return one Groq client per API key.
+
+    Each Groq client owns an HTTP connection pool; sharing it lets every
+    LLMClient (and every concurrent section request) reuse open keep-alive
+    connections instead of paying a new TLS handshake. Only the most
+    recently used keys are kept.
+    """
+    return groq_cls(api_key=api_key)
+
+
 class LLMClient:
     """
     Unified client for LLM providers.
@@ -42,6 +108,11 @@ class LLMClient:
     3. Ollama (local fallback, privacy-focused)
     """
     
+    __slots__ = (
+        "provider", "temperature", "api_key", "model",
+        "_client", "_generate_fn",
+    )
+    
     def __init__(
         self,
         provider: LLMProvider = LLMProvider.GEMINI,
@@ -77,16 +148,18 @@ class LLMClient:
         self._client = None
         self._initialize_client()
         
+        # The provider is fixed for the client's lifetime, so dispatch once
+        self._generate_fn = {
+            LLMProvider.GEMINI: self._generate_gemini,
+            LLMProvider.GROQ: self._generate_groq,
+            LLMProvider.OLLAMA: self._generate_ollama,
+        }.get(provider)
+        
         logger.info(f"LLM Client initialized: provider={provider}, model={self.model}")
     
     def _get_default_model(self) -> str:
         """Get default model for provider."""
-        defaults = {
-            LLMProvider.GEMINI: "gemini-2.5-flash",  # Fast and efficient model
-            LLMProvider.GROQ: "mixtral-8x7b-32768",
-            LLMProvider.OLLAMA: "llama2",
-        }
-        return defaults.get(self.provider, "gemini-2.5-flash")
+        return _DEFAULT_MODELS.get(self.provider, "gemini-2.5-flash")
     
     def _initialize_client(self):
         """Initialize provider-specific client."""
@@ -132,7 +205,7 @@ class LLMClient:
             if not self.api_key:
                 raise ValueError("GROQ_API_KEY not found in environment")
             
-            self._client = Groq(api_key=self.api_key)
+            self._client = _shared_groq_client(Groq, self.api_key)
             
             logger.info("Groq client initialized successfully")
         except ImportError:
@@ -154,11 +227,16 @@ class LLMClient:
                 "Install with: pip install ollama"
             )
     
-    @retry_llm_call
     def generate(self, prompt: str, max_tokens: int = 4096, temperature: Optional[float] = None) -> str:
         """
         Generate text using the LLM.
         
+        Low-temperature, non-empty responses are cached process-wide per
+        provider and model, so repeating a prompt (e.g. re-running
+        extraction on the same RFP with a new client) skips the provider
+        call. Callers that reject a response should `invalidate` it so a
+        retry reaches the provider again.
+        
         Args:
             prompt: Input prompt
             max_tokens: Maximum tokens to generate
@@ -173,15 +251,53 @@ class LLMClient:
         # Use provided temperature or fall back to instance temperature
         temp = temperature if temperature is not None else self.temperature
         
+        if RESPONSE_CACHE_SIZE <= 0 or temp > CACHEABLE_TEMPERATURE:
+            return self._generate_with_retry(prompt, max_tokens, temp)
+        
+        key = self._cache_key(prompt, max_tokens, temp)
+        with _response_cache_lock:
+            cached = _response_cache.get(key)
+            if cached is not None:
+                _response_cache.move_to_end(key)
+                logger.debug("LLM response cache hit")
+                return cached
+        
+        response = self._generate_with_retry(prompt, max_tokens, temp)
+        
+        # An empty answer is a failure the caller will retry, not a result
+        if not response or response.isspace():
+            return response
+        
+        with _response_cache_lock:
+            _response_cache[key] = response
+            _response_cache.move_to_end(key)
+            while len(_response_cache) > RESPONSE_CACHE_SIZE:
+                _response_cache.popitem(last=False)
+        return response
+    
+    def invalidate(self, prompt: str, max_tokens: int = 4096, temperature: Optional[float] = None) -> None:
+        """
+        Drop the cached response for a prompt.
+        
+        Call this when a response turned out to be unusable (e.g. invalid
+        JSON) so the next `generate` with the same arguments asks the
+        provider again instead of returning the same bad answer.
+        """
+        temp = temperature if temperature is not None else self.temperature
+        with _response_cache_lock:
+            _response_cache.pop(self._cache_key(prompt, max_tokens, temp), None)
+    
+    def _cache_key(self, prompt: str, max_tokens: int, temp: float) -> Tuple[str, str, float, int, str]:
+        """Build the response cache key for one generate call."""
+        return (self.provider.value, self.model, temp, max_tokens, prompt)
+    
+    @retry_llm_call
+    def _generate_with_retry(self, prompt: str, max_tokens: int, temp: float) -> str:
+        """Call the provider, retrying transient failures."""
         try:
-            if self.provider == LLMProvider.GEMINI:
-                return self._generate_gemini(prompt, temp)
-            elif self.provider == LLMProvider.GROQ:
-                return self._generate_groq(prompt, max_tokens, temp)
-            elif self.provider == LLMProvider.OLLAMA:
-                return self._generate_ollama(prompt, temp)
-            else:
+            if self._generate_fn is None:
                 raise ValueError(f"Unsupported provider: {self.provider}")
+            return self._generate_fn(prompt, max_tokens, temp)
         except LLMError:
             raise
         except Exception as e:
@@ -191,13 +307,13 @@ class LLMClient:
                 error_code="GENERATION_FAILED"
             ) from e
     
-    def _generate_gemini(self, prompt: str, temperature: float) -> str:
+    def _generate_gemini(self, prompt: str, max_tokens: int, temperature: float) -> str:
         """Generate with Gemini."""
         response = self._client.generate_content(
             prompt,
             generation_config={
                 "temperature": temperature,
-                "max_output_tokens": 4096,
+                "max_output_tokens": max_tokens,
             }
         )
         return response.text
@@ -212,8 +328,8 @@ class LLMClient:
         )
         return response.choices[0].message.content
     
-    def _generate_ollama(self, prompt: str, temperature: float) -> str:
-        """Generate with Ollama (local)."""
+    def _generate_ollama(self, prompt: str, max_tokens: int, temperature: float) -> str:
+        """Generate with Ollama (local); output length follows the model's own settings."""
         response = self._client.generate(
             model=self.model,
             prompt=prompt,
@@ -239,24 +355,29 @@ class LLMClient:
         Raises:
             ValueError: If no valid JSON found
         """
-        # Remove markdown code blocks if present
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            text = text[start:end].strip()
-        elif "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            text = text[start:end].strip()
+        # Limit the search to the markdown code block if present. Bounds are
+        # indices into `text`, so the response is only copied once, below.
+        lo, hi = 0, len(text)
+        fence = text.find("```json")
+        if fence != -1:
+            lo = fence + 7
+        else:
+            fence = text.find("```")
+            if fence != -1:
+                lo = fence + 3
+        if fence != -1:
+            close = text.find("```", lo)
+            if close != -1:
+                hi = close
         
         # Find JSON array
-        start_idx = text.find("[")
-        end_idx = text.rfind("]") + 1
+        start_idx = text.find("[", lo, hi)
+        end_idx = text.rfind("]", lo, hi) + 1
         
         if start_idx == -1 or end_idx == 0:
             # Try to find single JSON object and wrap in array
-            start_idx = text.find("{")
-            end_idx = text.rfind("}") + 1
+            start_idx = text.find("{", lo, hi)
+            end_idx = text.rfind("}", lo, hi) + 1
             if start_idx != -1 and end_idx != 0:
                 json_text = "[" + text[start_idx:end_idx] + "]"
             else:
@@ -265,10 +386,11 @@ class LLMClient:
             json_text = text[start_idx:end_idx]
         
         try:
-            data = json.loads(json_text)
+            data = _json_loads(json_text)
             if not isinstance(data, list):
                 data = [data]
             return data
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
         except json.JSONDecodeError as e:
             logger.error(f"JSON decode error: {e}\nText: {json_text[:200]}")
             raise ValueError(f"Invalid JSON in response: {e}")
@@ -281,48 +403,52 @@ class LLMClient:
             True if connection successful, False otherwise
         """
         try:
-            response = self.generate("Hello, respond with 'OK'")
+            # Bypass the response cache: this must reach the provider
+            response = self._generate_with_retry("Hello, respond with 'OK'", 4096, self.temperature)
             return len(response) > 0
         except Exception as e:
             logger.error(f"Connection test failed: {e}")
             return False
 
 
+@lru_cache(maxsize=None)
+def _is_module_installed(module_name: str) -> bool:
+    """
+    Check whether a provider SDK can be imported.
+    
+    Installed packages do not change while the app runs, so a missing SDK
+    costs one failed import search instead of one per availability check.
+    """
+    try:
+        importlib.import_module(module_name)
+        return True
+    except ImportError:
+        return False
+
+
 def _is_provider_available(provider: LLMProvider) -> Tuple[bool, Optional[str]]:
     """
     Check if a provider is available (installed and configured).
     
+    API keys are read on every call, so keys added to the environment
+    later are picked up.
+    
     Returns:
         Tuple of (is_available, error_message)
     """
-    if provider == LLMProvider.GEMINI:
-        try:
-            import google.generativeai
-            api_key = os.getenv("GEMINI_API_KEY")
-            if not api_key:
-                return False, "GEMINI_API_KEY not found in environment"
-            return True, None
-        except ImportError:
-            return False, "google-generativeai not installed"
+    packages = _PROVIDER_PACKAGES.get(provider)
+    if packages is None:
+        return False, "Unknown provider"
     
-    elif provider == LLMProvider.GROQ:
-        try:
-            import groq
-            api_key = os.getenv("GROQ_API_KEY")
-            if not api_key:
-                return False, "GROQ_API_KEY not found in environment"
-            return True, None
-        except ImportError:
-            return False, "groq not installed"
+    module_name, package_name = packages
+    if not _is_module_installed(module_name):
+        return False, f"{package_name} not installed"
     
-    elif provider == LLMProvider.OLLAMA:
-        try:
-            import ollama
-            return True, None
-        except ImportError:
-            return False, "ollama not installed"
+    env_var = _PROVIDER_API_KEY_ENV.get(provider)
+    if env_var and not os.getenv(env_var):
+        return False, f"{env_var} not found in environment"
     
-    return False, "Unknown provider"
+    return True, None
 
 
 def get_available_providers() -> List[LLMProvider]:
@@ -1,8 +1,11 @@
 """PDF Processing Service for extracting text from RFP documents."""
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 import io
+import multiprocessing
+import os
 
 try:
     import PyPDF2
@@ -13,19 +16,65 @@ except ImportError as e:
         "Run: pip install PyPDF2 pdfplumber"
     ) from e
 
+from services.file_validator import FileValidator
 from src.utils.error_handler import PDFError, handle_errors
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
+def _extract_pages(pages: Iterable) -> List[Tuple[str, Optional[str]]]:
+    """Extract text from pdfplumber pages as (text, error_message) pairs."""
+    results = []
+    for page in pages:
+        try:
+            results.append((page.extract_text() or "", None))
+        except Exception as e:
+            results.append(("", str(e)))
+    return results
+
+
+def _extract_page_range(pdf_bytes: bytes, start: int, stop: int) -> List[Tuple[str, Optional[str]]]:
+    """Open the PDF in a worker process and extract pages [start, stop)."""
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        return _extract_pages(pdf.pages[start:stop])
+
+
 class PDFProcessor:
     """Service for processing PDF files and extracting text."""
 
-    def __init__(self):
-        """Initialize PDF processor."""
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize PDF processor.
+
+        Args:
+            max_workers: Worker processes for pdfplumber extraction of large
+                PDFs (defaults to the CPU count; 1 disables parallelism)
+        """
         self.max_pages = 200  # Maximum pages to process
-        self.chunk_size = 10  # Process in chunks for large PDFs
+        self.chunk_size = 10  # Pages per worker task for large PDFs
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # Below this, starting worker processes costs more than it saves
+        self.parallel_min_pages = 16
+        # (file object, reader) for the most recently parsed file
+        self._cached_reader: Optional[Tuple[io.BytesIO, PyPDF2.PdfReader]] = None
+
+    def _get_reader(self, pdf_file: io.BytesIO) -> PyPDF2.PdfReader:
+        """
+        Return a PdfReader for the file, parsing it only once.
+
+        validate_pdf, get_pdf_info and PyPDF2 extraction are usually called
+        on the same upload; sharing the reader avoids re-parsing the xref
+        table and trailer for each call. Only the latest file is kept, since
+        the reader holds a reference to its stream.
+        """
+        if self._cached_reader is not None and self._cached_reader[0] is pdf_file:
+            return self._cached_reader[1]
+        
+        pdf_file.seek(0)
+        reader = PyPDF2.PdfReader(pdf_file)
+        self._cached_reader = (pdf_file, reader)
+        return reader
 
     def extract_text(
         self, 
@@ -92,8 +141,7 @@ class PDFProcessor:
         """
         logger.debug("Extracting text with PyPDF2")
         
-        pdf_file.seek(0)  # Reset file pointer
-        reader = PyPDF2.PdfReader(pdf_file)
+        reader = self._get_reader(pdf_file)
         
         page_count = len(reader.pages)
         if page_count > self.max_pages:
@@ -108,7 +156,8 @@ class PDFProcessor:
                 page = reader.pages[page_num]
                 text = page.extract_text() or ""
                 
-                if text.strip():
+                # isspace() stops at the first visible character; strip() would copy the page
+                if text and not text.isspace():
                     text_by_page[page_num + 1] = text
                     full_text_parts.append(f"--- Page {page_num + 1} ---\n{text}\n")
                 else:
@@ -118,9 +167,8 @@ class PDFProcessor:
                 logger.error(f"Error extracting page {page_num + 1}: {e}")
                 text_by_page[page_num + 1] = f"[Error extracting page {page_num + 1}]"
         
-        full_text = "\n".join(full_text_parts)
-        
-        if not full_text.strip():
+        # Only pages with visible text add a part, so no parts means no text
+        if not full_text_parts:
             raise PDFError(
                 "No text could be extracted from PDF",
                 pdf_path="<BytesIO>",
@@ -131,6 +179,7 @@ class PDFProcessor:
                 )
             )
         
+        full_text = "\n".join(full_text_parts)
         logger.info(f"Successfully extracted {len(full_text)} characters from {page_count} pages using PyPDF2")
         return full_text, text_by_page, page_count
 
@@ -157,23 +206,24 @@ class PDFProcessor:
         with pdfplumber.open(pdf_file) as pdf:
             page_count = min(len(pdf.pages), self.max_pages)
             
-            for page_num, page in enumerate(pdf.pages[:page_count], start=1):
-                try:
-                    text = page.extract_text() or ""
-                    
-                    if text.strip():
-                        text_by_page[page_num] = text
-                        full_text_parts.append(f"--- Page {page_num} ---\n{text}\n")
-                    else:
-                        logger.warning(f"Page {page_num} has no extractable text")
-                        
-                except Exception as e:
-                    logger.error(f"Error extracting page {page_num}: {e}")
-                    text_by_page[page_num] = f"[Error extracting page {page_num}]"
+            if self.max_workers > 1 and page_count >= self.parallel_min_pages:
+                pdf_file.seek(0)
+                page_results = self._extract_pages_in_parallel(pdf_file.read(), page_count)
+            else:
+                page_results = _extract_pages(pdf.pages[:page_count])
         
-        full_text = "\n".join(full_text_parts)
+        for page_num, (text, error) in enumerate(page_results, start=1):
+            if error is not None:
+                logger.error(f"Error extracting page {page_num}: {error}")
+                text_by_page[page_num] = f"[Error extracting page {page_num}]"
+            elif text and not text.isspace():
+                text_by_page[page_num] = text
+                full_text_parts.append(f"--- Page {page_num} ---\n{text}\n")
+            else:
+                logger.warning(f"Page {page_num} has no extractable text")
         
-        if not full_text.strip():
+        # Only pages with visible text add a part, so no parts means no text
+        if not full_text_parts:
             raise PDFError(
                 "No text could be extracted from PDF",
                 pdf_path="<BytesIO>",
@@ -184,9 +234,43 @@ class PDFProcessor:
                 )
             )
         
+        full_text = "\n".join(full_text_parts)
         logger.info(f"Successfully extracted {len(full_text)} characters from {page_count} pages using pdfplumber")
         return full_text, text_by_page, page_count
 
+    def _extract_pages_in_parallel(
+        self,
+        pdf_bytes: bytes,
+        page_count: int
+    ) -> List[Tuple[str, Optional[str]]]:
+        """
+        Extract pages with pdfplumber across worker processes.
+
+        Layout analysis is CPU-bound, so threads would serialize on the GIL.
+        Each task opens its own copy of the PDF and handles `chunk_size`
+        consecutive pages. Workers are spawned rather than forked so they
+        never inherit locks held by the app's other threads.
+
+        Returns:
+            (text, error_message) pairs in page order
+        """
+        ranges = [
+            (start, min(start + self.chunk_size, page_count))
+            for start in range(0, page_count, self.chunk_size)
+        ]
+        workers = min(self.max_workers, len(ranges))
+        logger.debug(f"Extracting {page_count} pages with {workers} worker processes")
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = [
+                executor.submit(_extract_page_range, pdf_bytes, start, stop)
+                for start, stop in ranges
+            ]
+            return [result for future in futures for result in future.result()]
+
     def validate_pdf(self, pdf_file: io.BytesIO) -> Tuple[bool, Optional[str]]:
         """
         Validate PDF file.
@@ -204,8 +288,13 @@ class PDFProcessor:
             return False, "Invalid PDF file object"
         
         try:
+            # Non-PDF bytes fail here without PyPDF2 parsing anything
             pdf_file.seek(0)
-            reader = PyPDF2.PdfReader(pdf_file)
+            if pdf_file.read(len(FileValidator.PDF_MAGIC)) != FileValidator.PDF_MAGIC:
+                logger.warning("PDF validation failed: missing %PDF- header")
+                return False, "PDF validation failed: file does not start with a %PDF- header."
+            
+            reader = self._get_reader(pdf_file)
             
             # Check if encrypted/password protected
             if reader.is_encrypted:
@@ -249,8 +338,7 @@ class PDFProcessor:
             Dictionary with PDF information
         """
         try:
-            pdf_file.seek(0)
-            reader = PyPDF2.PdfReader(pdf_file)
+            reader = self._get_reader(pdf_file)
             
             info = {
                 "page_count": len(reader.pages),
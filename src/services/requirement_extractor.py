@@ -6,14 +6,15 @@ using LLM-powered analysis with categorization, prioritization, and confidence s
 """
 
 from typing import List, Optional
-from datetime import datetime
 
 from models import RFP, Requirement, RequirementCategory, RequirementPriority
+from models._clock import shared_now
 from services.llm_client import LLMClient, create_llm_client
 from utils.prompt_templates import get_extraction_prompt, MAX_CHUNK_SIZE, CHUNK_OVERLAP
 from src.utils.logger import setup_logger
 from src.utils.error_handler import LLMError, ValidationError, handle_errors
 from src.utils.retry_utils import retry_llm_call
+from src.utils.concurrency import map_concurrently
 from src.utils.duplicate_detector import find_duplicate_requirements
 from src.utils.validators import validate_requirement
 from src.utils.mock_data import generate_mock_requirements, is_mock_data_enabled
@@ -39,6 +40,7 @@ class RequirementExtractor:
         self,
         llm_client: Optional[LLMClient] = None,
         min_confidence: float = 0.3,  # Minimum confidence to include a requirement
+        max_concurrency: int = 4,
     ):
         """
         Initialize requirement extractor.
@@ -46,9 +48,14 @@ class RequirementExtractor:
         Args:
             llm_client: LLM client to use (creates default if not provided)
             min_confidence: Minimum confidence threshold for requirements
+            max_concurrency: Maximum pages sent to the LLM at once
         """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        
         self.llm_client = llm_client or create_llm_client(fallback=True)
         self.min_confidence = min_confidence
+        self.max_concurrency = max_concurrency
         
         logger.info(f"RequirementExtractor initialized with min_confidence={min_confidence}")
     
@@ -80,11 +87,12 @@ class RequirementExtractor:
             return self._convert_mock_to_requirements(generate_mock_requirements(), rfp.id)
         
         try:
-            # Extract from full text or by page
-            if rfp.extracted_text_by_page:
-                requirements = self._extract_by_page(rfp)
-            else:
-                requirements = self._extract_from_text(rfp.extracted_text, rfp.id)
+            # Extract from full text or by page; one timestamp for the batch
+            with shared_now():
+                if rfp.extracted_text_by_page:
+                    requirements = self._extract_by_page(rfp)
+                else:
+                    requirements = self._extract_from_text(rfp.extracted_text, rfp.id)
             
             # Filter by confidence
             filtered_requirements = [
@@ -106,25 +114,20 @@ class RequirementExtractor:
             return self._convert_mock_to_requirements(generate_mock_requirements(count=5), rfp.id)
     
     def _extract_by_page(self, rfp: RFP) -> List[Requirement]:
-        """Extract requirements page by page."""
-        all_requirements = []
+        """Extract requirements page by page, several pages at a time."""
+        pages = [
+            (page_num, page_text)
+            for page_num, page_text in rfp.extracted_text_by_page.items()
+            if page_text.strip()
+        ]
         
-        for page_num, page_text in rfp.extracted_text_by_page.items():
-            if not page_text.strip():
-                continue
-            
-            logger.debug(f"Processing page {page_num}")
-            
-            try:
-                page_requirements = self._extract_from_text(
-                    page_text,
-                    rfp.id,
-                    page_number=page_num
-                )
-                all_requirements.extend(page_requirements)
-            except Exception as e:
-                logger.error(f"Error extracting from page {page_num}: {e}")
-                continue
+        all_requirements = []
+        for page_requirements in map_concurrently(
+            lambda page: self._extract_page(rfp.id, *page),
+            pages,
+            self.max_concurrency
+        ):
+            all_requirements.extend(page_requirements)
         
         # Deduplicate
         deduplicated = self._deduplicate_requirements(all_requirements)
@@ -136,6 +139,16 @@ class RequirementExtractor:
         
         return deduplicated
     
+    def _extract_page(self, rfp_id: str, page_num: int, page_text: str) -> List[Requirement]:
+        """Extract requirements from one page, logging and skipping failures."""
+        logger.debug(f"Processing page {page_num}")
+        
+        try:
+            return self._extract_from_text(page_text, rfp_id, page_number=page_num)
+        except Exception as e:
+            logger.error(f"Error extracting from page {page_num}: {e}")
+            return []
+    
     @retry_llm_call
     def _extract_from_text(
         self,
@@ -203,6 +216,8 @@ class RequirementExtractor:
             raise
         except Exception as e:
             logger.error(f"Unexpected error extracting requirements: {e}", exc_info=True)
+            # Don't let the retry get the same unusable response from the cache
+            self.llm_client.invalidate(prompt)
             raise LLMError(
                 f"Extraction failed: {str(e)}",
                 error_code="EXTRACTION_FAILED",
@@ -319,8 +334,6 @@ class RequirementExtractor:
             confidence=confidence,
             page_number=final_page,
             verified=False,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
         )
     
     def _deduplicate_requirements(
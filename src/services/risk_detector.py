@@ -9,11 +9,12 @@ classification, and recommendations.
 import logging
 import re
 from typing import List, Optional
-from datetime import datetime
 
 from models import RFP, Risk, RiskCategory, RiskSeverity
+from models._clock import shared_now
 from services.llm_client import LLMClient, create_llm_client
 from utils.prompt_templates import get_risk_detection_prompt, MAX_CHUNK_SIZE, CHUNK_OVERLAP
+from utils.concurrency import map_concurrently
 
 logger = logging.getLogger(__name__)
 
@@ -91,6 +92,7 @@ class RiskDetector:
         min_confidence: float = 0.3,  # Minimum confidence to include a risk
         use_patterns: bool = True,  # Enable pattern-based detection
         use_ai: bool = True,  # Enable AI-powered detection
+        max_concurrency: int = 4,
     ):
         """
         Initialize risk detector.
@@ -100,11 +102,16 @@ class RiskDetector:
             min_confidence: Minimum confidence threshold for risks
             use_patterns: Whether to use pattern-based detection
             use_ai: Whether to use AI-powered detection
+            max_concurrency: Maximum pages sent to the LLM at once
         """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        
         self.llm_client = llm_client or create_llm_client(fallback=True) if use_ai else None
         self.min_confidence = min_confidence
         self.use_patterns = use_patterns
         self.use_ai = use_ai
+        self.max_concurrency = max_concurrency
         
         logger.info(
             f"RiskDetector initialized with min_confidence={min_confidence}, "
@@ -131,20 +138,22 @@ class RiskDetector:
         
         all_risks = []
         
-        # Pattern-based detection
-        if self.use_patterns:
-            pattern_risks = self._detect_by_patterns(rfp)
-            all_risks.extend(pattern_risks)
-            logger.info(f"Pattern detection found {len(pattern_risks)} risks")
-        
-        # AI-powered detection
-        if self.use_ai:
-            if rfp.extracted_text_by_page:
-                ai_risks = self._detect_by_ai_by_page(rfp)
-            else:
-                ai_risks = self._detect_by_ai_from_text(rfp.extracted_text, rfp.id)
-            all_risks.extend(ai_risks)
-            logger.info(f"AI detection found {len(ai_risks)} risks")
+        # One timestamp for every risk detected in this pass
+        with shared_now():
+            # Pattern-based detection
+            if self.use_patterns:
+                pattern_risks = self._detect_by_patterns(rfp)
+                all_risks.extend(pattern_risks)
+                logger.info(f"Pattern detection found {len(pattern_risks)} risks")
+            
+            # AI-powered detection
+            if self.use_ai:
+                if rfp.extracted_text_by_page:
+                    ai_risks = self._detect_by_ai_by_page(rfp)
+                else:
+                    ai_risks = self._detect_by_ai_from_text(rfp.extracted_text, rfp.id)
+                all_risks.extend(ai_risks)
+                logger.info(f"AI detection found {len(ai_risks)} risks")
         
         # Deduplicate
         deduplicated_risks = self._deduplicate_risks(all_risks)
@@ -222,36 +231,39 @@ class RiskDetector:
                         recommendation=f"Review {category.value} clause: {clause_text[:100]}...",
                         alternative_language="[Review and negotiate alternative language]",
                         acknowledged=False,
-                        created_at=datetime.now(),
-                        updated_at=datetime.now(),
                     )
                     risks.append(risk)
         
         return risks
     
     def _detect_by_ai_by_page(self, rfp: RFP) -> List[Risk]:
-        """Detect risks page by page using AI."""
-        all_risks = []
+        """Detect risks page by page using AI, several pages at a time."""
+        pages = [
+            (page_num, page_text)
+            for page_num, page_text in rfp.extracted_text_by_page.items()
+            if page_text.strip()
+        ]
         
-        for page_num, page_text in rfp.extracted_text_by_page.items():
-            if not page_text.strip():
-                continue
-            
-            logger.debug(f"Processing page {page_num} for AI risk detection")
-            
-            try:
-                page_risks = self._detect_by_ai_from_text(
-                    page_text,
-                    rfp.id,
-                    page_number=page_num
-                )
-                all_risks.extend(page_risks)
-            except Exception as e:
-                logger.error(f"Error detecting risks from page {page_num}: {e}")
-                continue
+        all_risks = []
+        for page_risks in map_concurrently(
+            lambda page: self._detect_page(rfp.id, *page),
+            pages,
+            self.max_concurrency
+        ):
+            all_risks.extend(page_risks)
         
         return all_risks
     
+    def _detect_page(self, rfp_id: str, page_num: int, page_text: str) -> List[Risk]:
+        """Detect risks on one page, logging and skipping failures."""
+        logger.debug(f"Processing page {page_num} for AI risk detection")
+        
+        try:
+            return self._detect_by_ai_from_text(page_text, rfp_id, page_number=page_num)
+        except Exception as e:
+            logger.error(f"Error detecting risks from page {page_num}: {e}")
+            return []
+    
     def _detect_by_ai_from_text(
         self,
         text: str,
@@ -297,6 +309,8 @@ class RiskDetector:
             
         except Exception as e:
             logger.error(f"Error detecting risks: {e}")
+            # Let the next detection run ask the provider again
+            self.llm_client.invalidate(prompt)
             return []
     
     def _detect_by_ai_from_chunks(
@@ -415,8 +429,6 @@ class RiskDetector:
             recommendation=recommendation,
             alternative_language=alternative_language,
             acknowledged=False,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
         )
     
     def _deduplicate_risks(
@@ -18,6 +18,18 @@ logger = logging.getLogger(__name__)
 class ServiceMatch:
     """Represents a match between a requirement and a service."""
     
+    __slots__ = (
+        "requirement_id",
+        "requirement_description",
+        "requirement_category",
+        "service_id",
+        "service_name",
+        "service_category",
+        "score",
+        "reasoning",
+        "approved",
+    )
+    
     def __init__(
         self,
         requirement_id: str,
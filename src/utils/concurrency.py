@@ -0,0 +1,49 @@
+"""
+Bounded concurrency helpers for I/O-bound work such as LLM calls.
+
+Provider calls spend almost all their time waiting on the network, so a
+small thread pool overlaps them without any change to the synchronous
+LLM client API.
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_concurrently(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+) -> List[R]:
+    """
+    Apply `func` to every item on a bounded thread pool.
+
+    Each call runs in a copy of the caller's context, so context variables
+    (e.g. the batch timestamp from `models._clock.shared_now`) stay visible
+    in worker threads.
+
+    Args:
+        func: Function to call once per item
+        items: Inputs
+        max_workers: Maximum calls in flight
+
+    Returns:
+        Results in the order of `items`
+
+    Raises:
+        Whatever `func` raises first, in item order, once all calls finish
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, func, item)
+            for item in items
+        ]
+        return [future.result() for future in futures]
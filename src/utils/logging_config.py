@@ -3,7 +3,7 @@
 import logging
 import sys
 from pathlib import Path
-from config import settings
+from config import get_settings
 
 
 def setup_logging(level: str = None) -> None:
@@ -12,6 +12,8 @@ def setup_logging(level: str = None) -> None:
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR). Defaults to DEBUG per BairesDev standards
     """
+    settings = get_settings()
+    
     # Default to DEBUG level as per BairesDev standards
     log_level = level or settings.log_level or "DEBUG"
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -429,7 +429,10 @@ def get_ai_assistant_prompt(
 
 # Draft Generation Prompts
 
-DRAFT_GENERATION_PROMPT_TEMPLATE = """You are an expert proposal writer specializing in B2B RFP responses. Your task is to generate a comprehensive, professional proposal draft based on the provided RFP, requirements, and service matches.
+# Shared opening of every section prompt. It depends only on the RFP context,
+# so all section prompts for one draft start with byte-identical text and
+# providers with implicit prefix caching (e.g. Gemini 2.5) can reuse it.
+SECTION_CONTEXT_TEMPLATE = """You are an expert proposal writer specializing in B2B RFP responses.
 
 ## RFP Information:
 {rfp_info}
@@ -442,66 +445,22 @@ DRAFT_GENERATION_PROMPT_TEMPLATE = """You are an expert proposal writer speciali
 
 ## Detected Risks:
 {risks_summary}
+"""
 
-## Generation Instructions:
-{instructions}
-
-## Required Sections:
-
-Generate a complete proposal with the following sections (in order):
-
-1. **Executive Summary** (150-300 words)
-   - Overview of your understanding of the RFP
-   - Key value propositions
-   - Why you're the right partner
-
-2. **Approach** (300-500 words)
-   - Your methodology and approach to the project
-   - Key phases and milestones
-   - How you'll deliver value
-
-3. **Services & Solutions** (400-600 words)
-   - Detailed description of services that match requirements
-   - How each service addresses specific requirements
-   - Technical capabilities and differentiators
-
-4. **Timeline** (150-250 words)
-   - Project timeline with key milestones
-   - Delivery schedule
-   - Dependencies and assumptions
-
-5. **Pricing** (200-300 words)
-   - Pricing structure and model
-   - Cost breakdown (if appropriate)
-   - Payment terms
-
-6. **Risk Mitigation** (200-400 words)
-   - Address detected risks from the RFP
-   - Your approach to mitigating concerns
-   - Alternative language or terms where appropriate
-
-## Writing Guidelines:
-
-- **Tone:** {tone}
-- **Audience:** {audience}
-- **Word Count:** Target {word_count} words total (distribute across sections)
-- **Style:** Professional, clear, persuasive but not salesy
-- **Format:** Use Markdown formatting (headings, lists, bold for emphasis)
-- **Specificity:** Be specific about how you'll meet requirements
-- **Risk Awareness:** Address risks proactively and professionally
-
-## Important:
-
-- Reference specific requirements when describing services
-- Address all critical risks identified
-- Use the service matches to structure the Services section
-- Ensure the proposal is complete and ready for review
-- Maintain consistency in tone and style throughout
-
-Now generate the complete proposal draft:"""
+SECTION_GUIDELINES = {
+    "executive_summary": "Provide a high-level overview, key value propositions, and why you're the right partner.",
+    "approach": "Describe your methodology, key phases, milestones, and how you'll deliver value.",
+    "services": "Detail services that match requirements, how each addresses specific needs, and technical capabilities.",
+    "timeline": "Provide project timeline with milestones, delivery schedule, and dependencies.",
+    "pricing": "Present pricing structure, cost breakdown, and payment terms.",
+    "risk_mitigation": "Address detected risks, your mitigation approach, and alternative terms."
+}
+DEFAULT_SECTION_GUIDELINE = "Provide relevant content for this section."
 
 
-def get_draft_generation_prompt(
+def get_section_generation_prompt(
+    section_type: str,
+    section_title: str,
     rfp_info: str,
     requirements_summary: str,
     service_matches: str,
@@ -509,38 +468,57 @@ def get_draft_generation_prompt(
     instructions: str = "",
     tone: str = "professional",
     audience: str = "enterprise",
-    word_count: int = 2000
+    word_count: int = 300
 ) -> str:
     """
-    Generate draft generation prompt.
+    Generate prompt for writing one section of a new draft.
+    
+    Sections of a draft are generated independently (and concurrently), so
+    this prompt carries the full RFP context but no other section content.
     
     Args:
-        rfp_info: RFP title and summary
-        requirements_summary: Summary of requirements
-        service_matches: Description of matched services
-        risks_summary: Summary of detected risks
-        instructions: Custom instructions from user
-        tone: Writing tone (professional, friendly, formal)
-        audience: Target audience (enterprise, SMB, etc.)
-        word_count: Target word count
+        section_type: Type of section (executive_summary, approach, etc.)
+        section_title: Title of the section
+        rfp_info: RFP information
+        requirements_summary: Requirements summary
+        service_matches: Service matches
+        risks_summary: Risks summary
+        instructions: Custom instructions
+        tone: Writing tone
+        audience: Target audience
+        word_count: Target word count for this section
         
     Returns:
         Formatted prompt ready for LLM
     """
-    # Default instructions if not provided
-    if not instructions:
-        instructions = "Write comprehensive answers with professional tone and voice for an enterprise audience."
+    guideline = SECTION_GUIDELINES.get(section_type, DEFAULT_SECTION_GUIDELINE)
     
-    return DRAFT_GENERATION_PROMPT_TEMPLATE.format(
+    context = SECTION_CONTEXT_TEMPLATE.format(
         rfp_info=rfp_info,
         requirements_summary=requirements_summary,
         service_matches=service_matches,
-        risks_summary=risks_summary,
-        instructions=instructions,
-        tone=tone,
-        audience=audience,
-        word_count=word_count
+        risks_summary=risks_summary
     )
+    
+    return context + f"""
+## Task:
+Write the "{section_title}" section of the proposal based on the RFP, requirements, and service matches above.
+
+## Section Guidelines:
+{guideline}
+
+## Generation Instructions:
+{instructions or 'Write comprehensive answers with professional tone and voice for an enterprise audience.'}
+
+## Requirements:
+- **Tone:** {tone}
+- **Audience:** {audience}
+- **Word Count:** Target {word_count} words
+- **Format:** Use Markdown formatting (lists, bold for emphasis); do not repeat the section heading
+- **Specificity:** Be specific about how you'll meet requirements
+- **Risk Awareness:** Address risks proactively and professionally
+
+Generate ONLY the {section_title} section content:"""
 
 
 def get_section_regeneration_prompt(
@@ -575,34 +553,22 @@ def get_section_regeneration_prompt(
     Returns:
         Formatted prompt ready for LLM
     """
-    section_guidelines = {
-        "executive_summary": "Provide a high-level overview, key value propositions, and why you're the right partner.",
-        "approach": "Describe your methodology, key phases, milestones, and how you'll deliver value.",
-        "services": "Detail services that match requirements, how each addresses specific needs, and technical capabilities.",
-        "timeline": "Provide project timeline with milestones, delivery schedule, and dependencies.",
-        "pricing": "Present pricing structure, cost breakdown, and payment terms.",
-        "risk_mitigation": "Address detected risks, your mitigation approach, and alternative terms."
-    }
+    guideline = SECTION_GUIDELINES.get(section_type, DEFAULT_SECTION_GUIDELINE)
     
-    guideline = section_guidelines.get(section_type, "Provide relevant content for this section.")
+    context = SECTION_CONTEXT_TEMPLATE.format(
+        rfp_info=rfp_info,
+        requirements_summary=requirements_summary,
+        service_matches=service_matches,
+        risks_summary=risks_summary
+    )
     
-    prompt = f"""You are an expert proposal writer. Regenerate the "{section_title}" section of a B2B RFP proposal.
-
-## RFP Information:
-{rfp_info}
-
-## Requirements Summary:
-{requirements_summary}
-
-## Service Matches:
-{service_matches}
-
-## Detected Risks:
-{risks_summary}
-
+    prompt = context + f"""
 ## Other Sections (for context):
 {other_sections}
 
+## Task:
+Regenerate the "{section_title}" section of this B2B RFP proposal.
+
 ## Section Guidelines:
 {guideline}
 
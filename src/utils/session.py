@@ -1,7 +1,7 @@
 """Session state management for Streamlit."""
 
 import streamlit as st
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from models import RFP, Requirement, Service, Risk, Draft
 # ServiceMatch imported locally to avoid circular dependency
 
@@ -94,3 +94,28 @@ def update_approved_matches():
     """Update approved_matches list based on service_matches approval status."""
     st.session_state["approved_matches"] = get_approved_matches()
 
+
+def has_cached_extraction(file_hash: str) -> bool:
+    """Check if text for these upload bytes was already extracted this session."""
+    return bool(file_hash) and file_hash in st.session_state.get("extraction_by_hash", {})
+
+
+def extract_rfp_text(processor, pdf_file, file_hash: str = "") -> Tuple[str, Dict[int, str], int]:
+    """
+    Extract text from an uploaded PDF, reusing the result for identical bytes.
+    
+    Results are kept by content hash under "extraction_by_hash", separate from
+    the current RFP, so uploading the same file again after "Upload Another
+    RFP" skips the PDF parser.
+    
+    Returns:
+        Tuple of (full_text, text_by_page, page_count)
+    """
+    cache = st.session_state.setdefault("extraction_by_hash", {})
+    if file_hash and file_hash in cache:
+        return cache[file_hash]
+    
+    result = processor.extract_text(pdf_file=pdf_file, preserve_layout=True)
+    if file_hash:
+        cache[file_hash] = result
+    return result
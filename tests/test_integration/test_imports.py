@@ -80,6 +80,16 @@ class TestModelImports:
         # Verify Risk is actually the Risk class, not RiskClause
         assert Risk.__name__ == "Risk"
         assert RiskDirect.__name__ == "Risk"
+    
+    def test_models_package_exports_are_lazy(self):
+        """Test lazy package exports resolve to the submodule classes."""
+        import models
+        from models.draft import Draft as DraftDirect
+        
+        assert models.Draft is DraftDirect
+        assert "Draft" in dir(models)
+        with pytest.raises(AttributeError):
+            models.NotAModel
 
 
 class TestServiceImports:
@@ -0,0 +1,52 @@
+"""
+Unit tests for the context-scoped model clock.
+"""
+
+from datetime import datetime
+
+from models._clock import now, parse_datetime, shared_now
+from models.requirement import Requirement
+
+
+class TestSharedNow:
+    """Test batch timestamp sharing."""
+    
+    def test_models_share_batch_timestamp(self):
+        """Test models built inside shared_now() get the same timestamps."""
+        with shared_now() as batch_time:
+            first = Requirement(rfp_id="rfp-1", description="First")
+            second = Requirement(rfp_id="rfp-1", description="Second")
+        
+        assert first.created_at is batch_time
+        assert first.updated_at is batch_time
+        assert second.created_at is batch_time
+    
+    def test_explicit_timestamp(self):
+        """Test a caller-supplied batch timestamp is used."""
+        fixed = datetime(2025, 11, 1, 12, 0, 0)
+        with shared_now(fixed):
+            assert now() is fixed
+    
+    def test_clock_restored_after_block(self):
+        """Test the live clock is used again after the block exits."""
+        fixed = datetime(2020, 1, 1)
+        with shared_now(fixed):
+            pass
+        
+        assert now() > fixed
+
+
+class TestParseDatetime:
+    """Test ISO timestamp parsing helper."""
+    
+    def test_parses_iso_string(self):
+        """Test ISO strings become datetimes."""
+        assert parse_datetime("2025-11-10T12:00:00") == datetime(2025, 11, 10, 12, 0, 0)
+    
+    def test_passthrough_and_empty(self):
+        """Test datetimes and None pass through and empty strings become None."""
+        value = datetime(2025, 1, 1)
+        
+        assert parse_datetime(value) is value
+        assert parse_datetime(None) is None
+        assert parse_datetime("") is None
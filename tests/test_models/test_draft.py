@@ -55,6 +55,7 @@ class TestDraftModel:
         assert draft.generated_by == GenerationMethod.AI
         assert draft.sections == []
         assert draft.word_count == 0
+        assert draft.generated_date == draft.created_date == draft.last_modified
     
     def test_create_draft_with_sections(self):
         """Test creating a draft with sections."""
@@ -115,6 +116,14 @@ class TestDraftModel:
         assert draft.title == "Import Test"
         assert draft.status == DraftStatus.GENERATED
         assert draft.generated_by == GenerationMethod.MANUAL
+    
+    def test_string_enums_coerced_on_init(self):
+        """Test string status/generated_by are converted to enums."""
+        draft = Draft(rfp_id="rfp-005", status="reviewed", generated_by="hybrid")
+        
+        assert draft.status == DraftStatus.REVIEWED
+        assert draft.generated_by == GenerationMethod.HYBRID
+        assert draft.to_dict()["status"] == "reviewed"
 
 
 class TestDraftStatus:
@@ -0,0 +1,38 @@
+"""
+Unit tests for the pooled UUID generator used by model id factories.
+"""
+
+import uuid
+
+import pytest
+from models._idpool import UUIDPool, new_id, new_uuid
+
+
+class TestUUIDPool:
+    """Test UUIDPool id generation."""
+    
+    def test_returns_version4_uuids(self):
+        """Test pooled ids are valid random UUIDs."""
+        value = new_uuid()
+        
+        assert isinstance(value, uuid.UUID)
+        assert value.version == 4
+    
+    def test_ids_unique_across_refills(self):
+        """Test ids stay unique when the buffer is refilled."""
+        pool = UUIDPool(chunk_size=64)
+        ids = {pool.next_uuid() for _ in range(100)}
+        
+        assert len(ids) == 100
+    
+    def test_invalid_chunk_size(self):
+        """Test chunk size must hold whole UUIDs."""
+        with pytest.raises(ValueError):
+            UUIDPool(chunk_size=10)
+    
+    def test_new_id_prefixes_uuid_hex(self):
+        """Test prefixed ids end in a version 4 UUID's hex form."""
+        value = new_id("req-")
+        
+        assert value.startswith("req-")
+        assert uuid.UUID(hex=value[len("req-"):]).version == 4
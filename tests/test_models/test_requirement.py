@@ -19,6 +19,7 @@ from models.requirement import (
     RequirementPriority,
     get_category_display_names,
     get_priority_display_names,
+    summarize_requirements,
 )
 
 
@@ -41,7 +42,8 @@ class TestRequirementModel:
         assert req.verified is False
         assert req.notes == ""
         assert isinstance(req.id, str)
-        assert len(req.id) > 0
+        assert req.id.startswith("req-")
+        assert len(req.id) == len("req-") + 32
     
     def test_create_requirement_with_all_fields(self):
         """Test creating a requirement with all fields specified."""
@@ -108,6 +110,11 @@ class TestRequirementModel:
         )
         assert req.priority == RequirementPriority.HIGH
     
+    def test_invalid_category_string(self):
+        """Test unknown category strings are rejected."""
+        with pytest.raises(ValueError, match="not a valid RequirementCategory"):
+            Requirement(rfp_id="test", description="Test", category="marketing")
+    
     def test_to_dict(self):
         """Test serialization to dictionary."""
         req = Requirement(
@@ -158,6 +165,17 @@ class TestRequirementModel:
         assert req.page_number == 7
         assert req.verified is True
     
+    def test_from_dict_partial_data(self):
+        """Test missing keys use defaults and the input dict is left untouched."""
+        data = {"rfp_id": "test-rfp-1", "description": "Partial", "created_at": "2025-11-10T12:00:00"}
+        
+        req = Requirement.from_dict(data)
+        
+        assert req.id
+        assert req.category == RequirementCategory.FUNCTIONAL
+        assert req.created_at == datetime(2025, 11, 10, 12, 0, 0)
+        assert data["created_at"] == "2025-11-10T12:00:00"
+    
     def test_update_method(self):
         """Test updating requirement fields."""
         req = Requirement(
@@ -179,6 +197,24 @@ class TestRequirementModel:
         assert req.notes == "Added notes"
         assert req.updated_at > original_updated_at
     
+    def test_equality_by_id(self):
+        """Test requirements compare and hash by id only."""
+        original = Requirement(id="req-1", description="Original")
+        edited = Requirement(id="req-1", description="Edited", verified=True)
+        other = Requirement(id="req-2", description="Original")
+        
+        assert original == edited
+        assert original != other
+        assert len({original, edited, other}) == 2
+    
+    def test_uses_slots(self):
+        """Test requirement instances have no per-instance __dict__."""
+        req = Requirement(rfp_id="test", description="Slotted")
+        
+        assert not hasattr(req, "__dict__")
+        with pytest.raises(AttributeError):
+            req.not_a_field = True
+    
     def test_get_confidence_label_very_high(self):
         """Test confidence label for very high confidence."""
         req = Requirement(rfp_id="test", description="Test", confidence=0.95)
@@ -211,6 +247,14 @@ class TestRequirementModel:
         assert req_medium.get_priority_color() == "#FFBB00"
         assert req_low.get_priority_color() == "#4CAF50"
     
+    def test_ui_lookups_fall_back_after_update(self):
+        """Test unknown values set via update() fall back instead of raising."""
+        req = Requirement(rfp_id="test", description="Test")
+        req.update(priority="urgent", category="misc")
+        
+        assert req.get_priority_color() == "#808080"
+        assert req.get_category_icon() == "📋"
+    
     def test_get_category_icon(self):
         """Test category icons for UI."""
         categories_icons = {
@@ -266,4 +310,30 @@ class TestRequirementEnums:
         assert len(names) == 4
 
 
-
+class TestSummarizeRequirements:
+    """Test single-pass requirement statistics."""
+    
+    def test_summary_counts(self):
+        """Test counts, average confidence and category breakdown."""
+        requirements = [
+            Requirement(description="A", category="technical", priority="critical", confidence=0.9, verified=True),
+            Requirement(description="B", category="technical", priority="low", confidence=0.5),
+            Requirement(description="C", category="budget", priority="critical", confidence=0.7),
+        ]
+        
+        stats = summarize_requirements(requirements)
+        
+        assert stats["total"] == 3
+        assert stats["verified"] == 1
+        assert stats["critical"] == 2
+        assert stats["high_confidence"] == 1
+        assert stats["avg_confidence"] == pytest.approx(0.7)
+        assert stats["category_counts"] == {"technical": 2, "budget": 1}
+    
+    def test_summary_empty(self):
+        """Test empty input yields zeroed statistics."""
+        stats = summarize_requirements([])
+        
+        assert stats["total"] == 0
+        assert stats["avg_confidence"] == 0.0
+        assert stats["category_counts"] == {}
@@ -55,6 +55,14 @@ class TestRFPModel:
         
         assert rfp.is_overdue() is False
     
+    def test_is_overdue_with_reference_time(self):
+        """Test is_overdue honours a caller-supplied reference time."""
+        deadline = datetime(2025, 11, 1)
+        rfp = RFP(deadline=deadline)
+        
+        assert rfp.is_overdue(now=deadline - timedelta(hours=1)) is False
+        assert rfp.is_overdue(now=deadline + timedelta(hours=1)) is True
+    
     def test_days_until_deadline(self):
         """Test days_until_deadline calculation."""
         future_deadline = datetime.now() + timedelta(days=5)
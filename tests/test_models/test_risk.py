@@ -251,6 +251,7 @@ class TestRiskModel:
         assert risk.acknowledged is True
         assert risk.acknowledgment_notes == "Will negotiate this clause"
         assert risk.acknowledged_at is not None
+        assert risk.acknowledged_at == risk.updated_at
         assert risk.updated_at > original_updated_at
     
     def test_acknowledge_without_notes(self):
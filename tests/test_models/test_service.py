@@ -40,7 +40,7 @@ class TestServiceModel:
         assert service.description == "AWS cloud services"
         assert service.category == ServiceCategory.TECHNICAL
         assert service.success_rate == 0.95
-        assert service.tags == []
+        assert list(service.tags) == []
     
     def test_create_service_with_tags(self):
         """Test creating a service with tags."""
@@ -56,6 +56,45 @@ class TestServiceModel:
         assert len(service.tags) == 3
         assert "ios" in service.tags
     
+    def test_category_string_coercion(self):
+        """Test string categories map to enum members and unknown ones raise."""
+        service = Service(
+            id="svc-003",
+            name="QA",
+            category="compliance",
+            description="Testing",
+            capabilities=[]
+        )
+        assert service.category is ServiceCategory.COMPLIANCE
+        
+        with pytest.raises(ValueError, match="not a valid ServiceCategory"):
+            Service(id="svc-004", name="X", category="unknown", description="", capabilities=[])
+    
+    def test_add_tag_copies_shared_default(self):
+        """Test add_tag never mutates the shared empty default."""
+        first = Service(id="svc-a", name="A", category="technical", description="", capabilities=[])
+        second = Service(id="svc-b", name="B", category="technical", description="", capabilities=[])
+        
+        first.add_tag("cloud")
+        
+        assert first.tags == ["cloud"]
+        assert list(second.tags) == []
+    
+    def test_get_full_text_includes_added_tag(self):
+        """Test full text reflects tags added after creation."""
+        service = Service(
+            id="svc-c",
+            name="Cloud",
+            category="technical",
+            description="Infra",
+            capabilities=["AWS"]
+        )
+        
+        assert service.get_full_text() == "Cloud Infra AWS"
+        
+        service.add_tag("devops")
+        assert service.get_full_text() == "Cloud Infra AWS devops"
+    
     def test_service_to_dict(self):
         """Test converting service to dictionary."""
         service = Service(
@@ -171,3 +210,18 @@ class TestLoadServices:
             assert service.description
             assert service.category
 
+    def test_get_default_services_returns_fresh_services(self):
+        """Test edits to returned services don't leak into later calls."""
+        first = get_default_services()
+        original_rate = first[0].success_rate
+        first[0].capabilities.append("Mainframe")
+        first[0].add_tag("legacy")
+        first[0].success_rate = 0.5
+        
+        second = get_default_services()
+        
+        assert first[0] is not second[0]
+        assert "Mainframe" not in second[0].capabilities
+        assert "legacy" not in second[0].tags
+        assert second[0].success_rate == original_rate
+
@@ -104,6 +104,11 @@ class TestAIMessage:
         assert msg_dict["role"] == "assistant"
         assert msg_dict["content"] == "Response"
         assert "timestamp" in msg_dict
+    
+    def test_aimessage_uses_slots(self):
+        """Test AIMessage instances carry no per-instance __dict__."""
+        msg = AIMessage("user", "Hello")
+        assert not hasattr(msg, "__dict__")
 
 
 class TestAIAssistant:
@@ -230,6 +235,14 @@ class TestAIAssistant:
         assert "```" not in response
         assert "This is the actual response" in response
     
+    def test_clean_response_fence_variants(self, mock_llm_client):
+        """Test fenced responses with a language tag or surrounding whitespace."""
+        assistant = AIAssistant(llm_client=mock_llm_client)
+        
+        assert assistant._clean_response("  ```markdown\nLine 1\nLine 2\n```  ") == "Line 1\nLine 2"
+        assert assistant._clean_response("```unterminated") == "```unterminated"
+        assert assistant._clean_response("  plain answer \n") == "plain answer"
+    
     def test_clear_history(self, mock_llm_client):
         """Test clearing conversation history."""
         assistant = AIAssistant(llm_client=mock_llm_client)
@@ -242,6 +255,21 @@ class TestAIAssistant:
         
         assert len(assistant.conversation_history) == 0
     
+    def test_history_is_bounded(self, mock_llm_client):
+        """Test history drops the oldest messages and prompts see only the last few."""
+        with patch("services.ai_assistant.MAX_HISTORY_MESSAGES", 4), \
+                patch("services.ai_assistant.get_ai_assistant_prompt", return_value="prompt") as mock_prompt:
+            assistant = AIAssistant(llm_client=mock_llm_client)
+            for i in range(5):
+                assistant.ask(f"Question {i}")
+        
+        assert len(assistant.conversation_history) == 4
+        assert assistant.conversation_history[0].content == "Question 3"
+        
+        recent = mock_prompt.call_args.kwargs["conversation_history"]
+        assert len(recent) == 5
+        assert recent[-1].content == "Question 4"
+    
     def test_get_history(self, mock_llm_client):
         """Test getting conversation history as dictionaries."""
         assistant = AIAssistant(llm_client=mock_llm_client)
@@ -255,6 +283,18 @@ class TestAIAssistant:
         assert "timestamp" in history[0]
         assert "timestamp" in history[1]
     
+    def test_get_history_limit(self, mock_llm_client):
+        """Test get_history converts only the most recent messages when limited."""
+        assistant = AIAssistant(llm_client=mock_llm_client)
+        assistant.ask("Question 1")
+        assistant.ask("Question 2")
+        
+        history = assistant.get_history(limit=2)
+        
+        assert [msg["role"] for msg in history] == ["user", "assistant"]
+        assert history[0]["content"] == "Question 2"
+        assert len(assistant.get_history(limit=10)) == 4
+    
     def test_get_last_response(self, mock_llm_client):
         """Test getting the last assistant response."""
         assistant = AIAssistant(llm_client=mock_llm_client)
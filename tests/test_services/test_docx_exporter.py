@@ -162,6 +162,21 @@ More content with **bold** and *italic* formatting.
         
         assert result is None
     
+    def test_exports_do_not_share_document_state(self):
+        """Test exports built from the cached template stay independent."""
+        from docx import Document
+
+        exporter = DocxExporter()
+        first = Draft(id="d-1", rfp_id="rfp-1", content="First only")
+        second = Draft(id="d-2", rfp_id="rfp-2", content="Second only")
+
+        exporter.export_to_docx(first)
+        result = exporter.export_to_docx(second)
+
+        texts = [p.text for p in Document(BytesIO(result)).paragraphs]
+        assert "Second only" in texts
+        assert "First only" not in texts
+    
     def test_generate_doc_title_with_rfp(self):
         """Test document title generation with RFP."""
         exporter = DocxExporter()
@@ -296,6 +311,22 @@ More content with **bold** and *italic* formatting.
         
         # Should add 4 list items
         assert doc.add_paragraph.call_count == 4
+
+    def test_add_markdown_content_keeps_blank_lines(self):
+        """Test each empty line produces its own spacing paragraph."""
+        exporter = DocxExporter()
+
+        doc = Mock()
+        doc.add_heading = Mock(return_value=Mock())
+        doc.add_paragraph = Mock(return_value=Mock())
+
+        content = "# Title\n\n\n\n- Item\n\n#NoSpace"
+
+        exporter._add_markdown_content(doc, content)
+
+        doc.add_heading.assert_called_once_with("Title", level=1)
+        # 3 blanks, bullet, blank, plain paragraph
+        assert doc.add_paragraph.call_count == 6
     
     def test_add_inline_formatting(self):
         """Test inline formatting (bold, italic, code)."""
@@ -311,6 +342,21 @@ More content with **bold** and *italic* formatting.
         # Should add multiple runs for different formats
         assert paragraph.add_run.call_count > 0
 
+    def test_add_inline_formatting_runs_in_order(self):
+        """Test inline formatting emits one run per segment, in order."""
+        from docx import Document
+
+        exporter = DocxExporter()
+        paragraph = Document().add_paragraph()
+
+        exporter._add_inline_formatting(paragraph, "a **b** *c* `d` 2 * 3")
+
+        runs = paragraph.runs
+        assert "".join(run.text for run in runs) == "a b c d 2 * 3"
+        assert [run.text for run in runs if run.bold] == ["b"]
+        assert [run.text for run in runs if run.italic] == ["c"]
+        assert [run.text for run in runs if run.font.name == 'Courier New'] == ["d"]
+
 
 class TestDocxExporterIntegration:
     """Integration tests for DocxExporter."""
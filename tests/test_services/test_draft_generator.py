@@ -2,6 +2,10 @@
 Unit tests for Draft Generator service.
 """
 
+import re
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
@@ -153,7 +157,85 @@ class TestDraftGenerator:
         assert draft.status == DraftStatus.GENERATED
         assert draft.generated_by == GenerationMethod.AI
         assert draft.generation_time is not None
-        mock_llm_client.generate.assert_called_once()
+        # One LLM call per standard section
+        assert mock_llm_client.generate.call_count == len(DraftGenerator.STANDARD_SECTIONS)
+    
+    def test_generate_draft_builds_standard_sections(self, mock_llm_client, sample_rfp, sample_requirements, sample_acknowledged_risks):
+        """Test each standard section comes from its own prompt, in order."""
+        def generate(prompt, temperature=None):
+            title = re.search(r'Write the "(.+?)" section', prompt).group(1)
+            return f"## {title}\n\nContent for {title}."
+        
+        mock_llm_client.generate.side_effect = generate
+        generator = DraftGenerator(llm_client=mock_llm_client)
+        
+        draft = generator.generate_draft(
+            rfp=sample_rfp,
+            requirements=sample_requirements,
+            risks=sample_acknowledged_risks,
+            word_count=3800
+        )
+        
+        expected_types = [s["type"] for s in DraftGenerator.STANDARD_SECTIONS]
+        assert [s.section_type for s in draft.sections] == expected_types
+        assert [s.order for s in draft.sections] == [1, 2, 3, 4, 5, 6]
+        # Repeated heading is stripped from the section body
+        assert draft.sections[0].content == "Content for Executive Summary."
+        assert draft.content.startswith("## Executive Summary\n\nContent for Executive Summary.")
+        assert draft.completeness_score == 1.0
+        # Section targets scale with the requested total (3800 = 2 x 1900)
+        prompts = [c.args[0] for c in mock_llm_client.generate.call_args_list]
+        assert any("Target 500 words" in p and '"Executive Summary"' in p for p in prompts)
+    
+    def test_build_generated_section_keeps_sub_headings(self, mock_llm_client):
+        """Test only a repeated section title is stripped, not other leading headings."""
+        generator = DraftGenerator(llm_client=mock_llm_client)
+        config = DraftGenerator.STANDARD_SECTIONS[3]
+        
+        section = generator._build_generated_section(config, "# TIMELINE\n\nPlan.")
+        assert section.content == "Plan."
+        
+        content = "### Phase 1: Discovery\n\nKickoff workshops."
+        section = generator._build_generated_section(config, content)
+        assert section.content == content
+    
+    def test_generate_draft_reports_sections_as_completed(self, mock_llm_client, sample_rfp, sample_requirements, sample_acknowledged_risks):
+        """Test on_section is called in the caller's thread for every section."""
+        generator = DraftGenerator(llm_client=mock_llm_client)
+        seen = []
+        
+        def on_section(section):
+            seen.append((section.section_type, threading.current_thread()))
+        
+        draft = generator.generate_draft(
+            rfp=sample_rfp,
+            requirements=sample_requirements,
+            risks=sample_acknowledged_risks,
+            on_section=on_section
+        )
+        
+        assert sorted(t for t, _ in seen) == sorted(s.section_type for s in draft.sections)
+        assert all(thread is threading.current_thread() for _, thread in seen)
+    
+    def test_generate_draft_cancels_pending_sections_on_error(self, mock_llm_client, sample_rfp, sample_requirements, sample_acknowledged_risks):
+        """Test a failed section stops calls that have not started yet."""
+        def generate(prompt, temperature=None):
+            if mock_llm_client.generate.call_count == 1:
+                raise Exception("LLM error")
+            time.sleep(0.05)  # Later calls are slow enough for cancellation to win
+            return "Content"
+        
+        mock_llm_client.generate.side_effect = generate
+        generator = DraftGenerator(llm_client=mock_llm_client, max_concurrency=1)
+        
+        with pytest.raises(Exception, match="LLM error"):
+            generator.generate_draft(
+                rfp=sample_rfp,
+                requirements=sample_requirements,
+                risks=sample_acknowledged_risks
+            )
+        
+        assert mock_llm_client.generate.call_count < len(DraftGenerator.STANDARD_SECTIONS)
     
     def test_generate_draft_with_critical_unacknowledged_risks(self, mock_llm_client, sample_rfp, sample_requirements):
         """Test that draft generation fails if critical risks not acknowledged."""
@@ -348,6 +430,61 @@ class TestDraftGenerator:
                 risks=sample_acknowledged_risks
             )
     
+    def test_regenerate_sections_concurrently(self, mock_llm_client, sample_rfp, sample_requirements, sample_acknowledged_risks):
+        """Test several sections are regenerated with overlapping LLM calls."""
+        generator = DraftGenerator(llm_client=mock_llm_client, max_concurrency=3)
+        draft = generator.generate_draft(
+            rfp=sample_rfp,
+            requirements=sample_requirements,
+            risks=sample_acknowledged_risks
+        )
+        
+        # Every call waits until three are in flight at once
+        barrier = threading.Barrier(3, timeout=5)
+        
+        def generate(prompt, temperature=None):
+            barrier.wait()
+            return "Regenerated content"
+        
+        mock_llm_client.generate.side_effect = generate
+        
+        sections = generator.regenerate_sections(
+            draft=draft,
+            section_types=["approach", "timeline", "pricing"],
+            rfp=sample_rfp,
+            requirements=sample_requirements,
+            risks=sample_acknowledged_risks
+        )
+        
+        assert [s.section_type for s in sections] == ["approach", "timeline", "pricing"]
+        assert all(s.content == "Regenerated content" for s in sections)
+        assert draft.get_section_by_type("executive_summary").content != "Regenerated content"
+    
+    def test_regenerate_sections_unknown_type(self, mock_llm_client, sample_rfp, sample_requirements, sample_acknowledged_risks):
+        """Test an unknown section fails before any LLM call is made."""
+        generator = DraftGenerator(llm_client=mock_llm_client)
+        draft = generator.generate_draft(
+            rfp=sample_rfp,
+            requirements=sample_requirements,
+            risks=sample_acknowledged_risks
+        )
+        mock_llm_client.generate.reset_mock()
+        
+        with pytest.raises(ValueError, match="Section.*not found"):
+            generator.regenerate_sections(
+                draft=draft,
+                section_types=["approach", "nonexistent_section"],
+                rfp=sample_rfp,
+                requirements=sample_requirements,
+                risks=sample_acknowledged_risks
+            )
+        mock_llm_client.generate.assert_not_called()
+    
+    def test_invalid_max_concurrency(self, mock_llm_client):
+        """Test max_concurrency must allow at least one call."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            DraftGenerator(llm_client=mock_llm_client, max_concurrency=0)
+    
     def test_build_rfp_info(self, mock_llm_client, sample_rfp):
         """Test building RFP information summary."""
         generator = DraftGenerator(llm_client=mock_llm_client)
@@ -434,51 +571,6 @@ class TestDraftGenerator:
         cleaned = generator._clean_draft_content(content_with_whitespace)
         assert cleaned == "Content"
     
-    def test_parse_sections(self, mock_llm_client):
-        """Test parsing sections from draft content."""
-        generator = DraftGenerator(llm_client=mock_llm_client)
-        
-        content = """# Executive Summary
-
-Summary content here.
-
-## Approach
-
-Approach content here.
-
-## Services
-
-Services content here."""
-        
-        sections = generator._parse_sections(content)
-        
-        assert len(sections) >= 2
-        assert any(s.section_type == "executive_summary" for s in sections)
-        assert any(s.section_type == "approach" for s in sections)
-    
-    def test_parse_sections_no_headings(self, mock_llm_client):
-        """Test parsing sections when content has no headings."""
-        generator = DraftGenerator(llm_client=mock_llm_client)
-        
-        content = "Just plain content without any headings."
-        sections = generator._parse_sections(content)
-        
-        assert len(sections) == 1
-        assert sections[0].section_type == "executive_summary"
-        assert sections[0].content == content
-    
-    def test_map_title_to_section_type(self, mock_llm_client):
-        """Test mapping section titles to section types."""
-        generator = DraftGenerator(llm_client=mock_llm_client)
-        
-        assert generator._map_title_to_section_type("Executive Summary") == "executive_summary"
-        assert generator._map_title_to_section_type("Approach") == "approach"
-        assert generator._map_title_to_section_type("Services & Solutions") == "services"
-        assert generator._map_title_to_section_type("Timeline") == "timeline"
-        assert generator._map_title_to_section_type("Pricing") == "pricing"
-        assert generator._map_title_to_section_type("Risk Mitigation") == "risk_mitigation"
-        assert generator._map_title_to_section_type("Unknown Section") == "other"
-    
     def test_get_other_sections_content(self, mock_llm_client, sample_rfp, sample_requirements, sample_acknowledged_risks):
         """Test getting other sections content for context."""
         generator = DraftGenerator(llm_client=mock_llm_client)
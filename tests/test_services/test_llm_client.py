@@ -16,10 +16,21 @@ import json
 import os
 import sys
 
-from services.llm_client import LLMClient, LLMProvider, create_llm_client
+from services.llm_client import (
+    LLMClient, LLMProvider, create_llm_client, clear_response_cache,
+    _GROQ_CLIENT_CACHE_SIZE, _shared_groq_client
+)
 from src.utils.error_handler import LLMError
 
 
+@pytest.fixture(autouse=True)
+def _empty_response_cache():
+    """Keep cached responses from leaking between tests."""
+    clear_response_cache()
+    yield
+    clear_response_cache()
+
+
 class TestLLMClient:
     """Test LLM Client initialization and basic functionality."""
     
@@ -51,6 +62,31 @@ class TestLLMClient:
                 assert client.model == "mixtral-8x7b-32768"
                 assert client._client is not None
     
+    def test_groq_clients_share_connection_pool(self):
+        """Test LLMClients with the same Groq key reuse one SDK client."""
+        mock_groq_module = MagicMock()
+        mock_groq_module.Groq.side_effect = lambda api_key: MagicMock()
+
+        with patch.dict('sys.modules', {'groq': mock_groq_module}):
+            first = LLMClient(provider=LLMProvider.GROQ, api_key='shared-key')
+            second = LLMClient(provider=LLMProvider.GROQ, api_key='shared-key')
+            other = LLMClient(provider=LLMProvider.GROQ, api_key='other-key')
+
+        assert first._client is second._client
+        assert other._client is not first._client
+        assert mock_groq_module.Groq.call_count == 2
+    
+    def test_shared_groq_clients_are_bounded(self):
+        """Test the per-key Groq client cache evicts old keys."""
+        mock_groq_module = MagicMock()
+        mock_groq_module.Groq.side_effect = lambda api_key: MagicMock()
+
+        with patch.dict('sys.modules', {'groq': mock_groq_module}):
+            for i in range(_GROQ_CLIENT_CACHE_SIZE + 2):
+                LLMClient(provider=LLMProvider.GROQ, api_key=f'key-{i}')
+
+        assert _shared_groq_client.cache_info().currsize == _GROQ_CLIENT_CACHE_SIZE
+    
     def test_initialization_without_api_key_raises_error(self):
         """Test that initialization without API key raises error."""
         with patch.dict(os.environ, {}, clear=True):
@@ -134,6 +170,83 @@ class TestLLMGeneration:
                 
                 assert result == "Generated response from Groq"
 
+    
+    def test_client_uses_slots(self):
+        """Test LLMClient instances carry no per-instance __dict__."""
+        with patch.dict('sys.modules', {'groq': MagicMock()}):
+            client = LLMClient(provider=LLMProvider.GROQ, api_key='slots-key')
+        
+        assert not hasattr(client, '__dict__')
+        with pytest.raises(AttributeError):
+            client.unexpected = True
+    
+    def test_low_temperature_responses_are_cached(self):
+        """Test repeated deterministic prompts reuse the cached response."""
+        mock_groq_module = MagicMock()
+        mock_groq_module.Groq.side_effect = lambda api_key: MagicMock()
+
+        with patch.dict('sys.modules', {'groq': mock_groq_module}):
+            client = LLMClient(provider=LLMProvider.GROQ, api_key='cache-key')
+        create = client._client.chat.completions.create
+        create.return_value.choices = [MagicMock(message=MagicMock(content="cached"))]
+
+        assert client.generate("Prompt A") == "cached"
+        assert client.generate("Prompt A") == "cached"
+        assert create.call_count == 1
+
+        # Higher temperatures always reach the provider
+        client.generate("Prompt A", temperature=0.7)
+        client.generate("Prompt A", temperature=0.7)
+        assert create.call_count == 3
+
+        # Least recently used prompt is evicted past the cache size
+        with patch('services.llm_client.RESPONSE_CACHE_SIZE', 2):
+            client.generate("Prompt B")
+            client.generate("Prompt C")
+            client.generate("Prompt A")
+        assert create.call_count == 6
+
+        clear_response_cache()
+        client.generate("Prompt C")
+        assert create.call_count == 7
+    
+    @patch('services.llm_client._is_provider_available', return_value=(True, None))
+    def test_cached_response_shared_across_clients(self, mock_is_available):
+        """Test a new client from create_llm_client reuses an earlier response."""
+        mock_groq_module = MagicMock()
+        create = mock_groq_module.Groq.return_value.chat.completions.create
+        create.return_value.choices = [MagicMock(message=MagicMock(content="shared"))]
+
+        with patch.dict(os.environ, {'GROQ_API_KEY': 'shared-cache-key'}):
+            with patch.dict('sys.modules', {'groq': mock_groq_module}):
+                first = create_llm_client(provider="groq", fallback=False)
+                second = create_llm_client(provider="groq", fallback=False)
+
+        assert first is not second
+        probes = create.call_count
+        assert first.generate("Extract requirements") == "shared"
+        assert second.generate("Extract requirements") == "shared"
+        assert create.call_count == probes + 1
+    
+    def test_empty_and_invalidated_responses_reach_provider_again(self):
+        """Test rejected responses are not served from the cache."""
+        mock_groq_module = MagicMock()
+        mock_groq_module.Groq.side_effect = lambda api_key: MagicMock()
+
+        with patch.dict('sys.modules', {'groq': mock_groq_module}):
+            client = LLMClient(provider=LLMProvider.GROQ, api_key='retry-key')
+        create = client._client.chat.completions.create
+        create.side_effect = [
+            MagicMock(choices=[MagicMock(message=MagicMock(content=content))])
+            for content in ["", "not json", "[]", "unused"]
+        ]
+
+        assert client.generate("Prompt") == ""
+        assert client.generate("Prompt") == "not json"
+        client.invalidate("Prompt")
+        assert client.generate("Prompt") == "[]"
+        assert client.generate("Prompt") == "[]"
+        assert create.call_count == 3
 
 class TestJSONExtraction:
     """Test JSON extraction from LLM responses."""
@@ -183,7 +296,18 @@ Hope this helps!'''
         result = client.extract_json(text)
         
         assert len(result) == 1
-    
+
+    def test_extract_json_ignores_brackets_outside_code_block(self):
+        """Test brackets after the closing fence are not part of the JSON."""
+        client = self._create_client_for_json_test()
+
+        text = '```json\n[{"name": "item1"}]\n```\nSee [1] and {note}'
+        assert client.extract_json(text) == [{"name": "item1"}]
+
+        # An unterminated block runs to the end of the response
+        text = '```json\n[{"name": "item1"}]'
+        assert client.extract_json(text) == [{"name": "item1"}]
+
     def test_extract_json_with_surrounding_text(self):
         """Test extracting JSON when surrounded by other text."""
         client = self._create_client_for_json_test()
@@ -293,6 +417,39 @@ class TestClientFactory:
                 assert client is not None
                 assert client.provider == LLMProvider.GROQ
     
+    @patch('services.llm_client._is_provider_available', return_value=(True, None))
+    @patch('services.llm_client.LLMClient')
+    def test_create_client_skips_fallbacks_when_primary_connects(self, mock_llm_class, mock_is_available):
+        """Test fallback providers are never contacted once the primary works."""
+        mock_llm_class.side_effect = lambda provider: Mock(provider=provider)
+        
+        client = create_llm_client(fallback=True)
+        
+        assert client.provider == LLMProvider.GEMINI
+        mock_llm_class.assert_called_once_with(provider=LLMProvider.GEMINI)
+        client.test_connection.assert_called_once()
+    
+    @patch('services.llm_client._is_provider_available', return_value=(True, None))
+    @patch('services.llm_client.LLMClient')
+    def test_create_client_probes_providers_in_order(self, mock_llm_class, mock_is_available):
+        """Test the next provider is only tried after the previous one fails."""
+        working = {LLMProvider.GROQ, LLMProvider.OLLAMA}
+        
+        def make_client(provider):
+            client = Mock(provider=provider)
+            client.test_connection.return_value = provider in working
+            return client
+        
+        mock_llm_class.side_effect = make_client
+        
+        client = create_llm_client(fallback=True)
+        
+        # Gemini failed; Groq is tried next and Ollama is never contacted
+        assert client.provider == LLMProvider.GROQ
+        assert [c.kwargs["provider"] for c in mock_llm_class.call_args_list] == [
+            LLMProvider.GEMINI, LLMProvider.GROQ
+        ]
+    
     @patch('services.llm_client.LLMClient')
     def test_create_client_all_providers_fail(self, mock_llm_class):
         """Test error when all providers fail."""
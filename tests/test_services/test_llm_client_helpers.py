@@ -44,3 +44,32 @@ class TestLLMClientHelpers:
         assert len(result) == 1
         assert result[0]["data"]["nested"] == "value"
 
+
+
+class TestProviderAvailability:
+    """Test provider availability checks."""
+    
+    def test_missing_sdk_reported_and_import_attempted_once(self):
+        """Test a missing SDK is reported without re-running the import search."""
+        from services import llm_client
+        
+        llm_client._is_module_installed.cache_clear()
+        with patch.object(llm_client.importlib, "import_module", side_effect=ImportError) as mock_import:
+            assert llm_client._is_provider_available(LLMProvider.OLLAMA) == (False, "ollama not installed")
+            assert llm_client._is_provider_available(LLMProvider.OLLAMA) == (False, "ollama not installed")
+        llm_client._is_module_installed.cache_clear()
+        
+        mock_import.assert_called_once_with("ollama")
+    
+    def test_api_key_read_on_each_check(self):
+        """Test API keys added to the environment later are picked up."""
+        import os
+        from services import llm_client
+        
+        with patch.object(llm_client, "_is_module_installed", return_value=True):
+            with patch.dict(os.environ, {}, clear=True):
+                assert llm_client._is_provider_available(LLMProvider.GROQ) == (
+                    False, "GROQ_API_KEY not found in environment"
+                )
+                os.environ["GROQ_API_KEY"] = "key"
+                assert llm_client._is_provider_available(LLMProvider.GROQ) == (True, None)
@@ -11,6 +11,7 @@ Tests cover:
 """
 
 import pytest
+import threading
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 
@@ -141,6 +142,67 @@ class TestRequirementExtractor:
         assert mock_client.generate.call_count == 2
         assert mock_client.generate.call_count == 2
     
+    def test_extract_by_page_runs_pages_concurrently(self):
+        """Test pages are sent to the LLM at the same time and share a timestamp."""
+        # Every call waits until both pages are in flight
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def generate(prompt):
+            barrier.wait()
+            return "LLM response"
+        
+        descriptions = iter([
+            "System must support single sign-on via SAML",
+            "Vendor shall deliver monthly budget reports",
+        ])
+        
+        mock_client = Mock()
+        mock_client.generate.side_effect = generate
+        mock_client.extract_json.side_effect = lambda response: [
+            {"description": next(descriptions), "category": "technical",
+             "priority": "high", "confidence": 0.9}
+        ]
+        
+        extractor = RequirementExtractor(llm_client=mock_client, max_concurrency=2)
+        
+        rfp = RFP(id="test", file_name="test.pdf")
+        rfp.extracted_text = "Page 1\nPage 2"
+        rfp.extracted_text_by_page = {1: "Page 1", 2: "Page 2"}
+        
+        requirements = extractor.extract_from_rfp(rfp)
+        
+        assert len(requirements) == 2
+        assert len({req.created_at for req in requirements}) == 1
+    
+    def test_retry_after_empty_response_reaches_provider(self):
+        """Test an empty cached-path response is retried against the provider."""
+        from services.llm_client import LLMClient, LLMProvider
+        
+        mock_groq_module = MagicMock()
+        mock_groq_module.Groq.side_effect = lambda api_key: MagicMock()
+        with patch.dict('sys.modules', {'groq': mock_groq_module}):
+            llm_client = LLMClient(provider=LLMProvider.GROQ, api_key='extract-key')
+        
+        create = llm_client._client.chat.completions.create
+        create.side_effect = [
+            MagicMock(choices=[MagicMock(message=MagicMock(content=content))])
+            for content in [
+                "",
+                '[{"description": "System must support SSO", "category": "technical", '
+                '"priority": "high", "confidence": 0.9}]',
+            ]
+        ]
+        
+        extractor = RequirementExtractor(llm_client=llm_client)
+        rfp = RFP(id="test", file_name="test.pdf")
+        rfp.extracted_text = "The system must support SSO."
+        
+        with patch('tenacity.nap.time.sleep'):
+            requirements = extractor.extract_from_rfp(rfp)
+        
+        assert create.call_count == 2
+        assert [req.description for req in requirements] == ["System must support SSO"]
+    
     def test_deduplication(self):
         """Test duplicate requirements are removed."""
         mock_client = Mock()
@@ -0,0 +1,53 @@
+"""
+Unit tests for concurrency helpers.
+"""
+
+import contextvars
+import threading
+
+import pytest
+
+from src.utils.concurrency import map_concurrently
+
+
+class TestMapConcurrently:
+    """Test bounded concurrent mapping."""
+    
+    def test_results_keep_input_order(self):
+        """Test results line up with inputs regardless of completion order."""
+        assert map_concurrently(lambda x: x * 2, [3, 1, 2], max_workers=3) == [6, 2, 4]
+    
+    def test_calls_overlap(self):
+        """Test calls run at the same time up to max_workers."""
+        # Every call waits until all three are in flight
+        barrier = threading.Barrier(3, timeout=5)
+        
+        def work(item):
+            barrier.wait()
+            return item
+        
+        assert map_concurrently(work, ["a", "b", "c"], max_workers=3) == ["a", "b", "c"]
+    
+    def test_context_is_propagated(self):
+        """Test worker threads see the caller's context variables."""
+        var = contextvars.ContextVar("var", default="unset")
+        token = var.set("caller")
+        try:
+            assert map_concurrently(lambda _: var.get(), range(3), max_workers=3) == ["caller"] * 3
+        finally:
+            var.reset(token)
+    
+    def test_error_propagates(self):
+        """Test an exception from any call is raised to the caller."""
+        def work(item):
+            if item == 2:
+                raise RuntimeError("boom")
+            return item
+        
+        with pytest.raises(RuntimeError, match="boom"):
+            map_concurrently(work, [1, 2, 3], max_workers=2)
+    
+    def test_single_worker_runs_inline(self):
+        """Test max_workers=1 runs calls in the caller's thread."""
+        caller = threading.get_ident()
+        assert map_concurrently(lambda _: threading.get_ident(), [1, 2], max_workers=1) == [caller, caller]
@@ -8,7 +8,8 @@ Tests cover:
 from utils.prompt_templates import (
     get_extraction_prompt,
     get_risk_detection_prompt,
-    get_draft_generation_prompt,
+    get_section_generation_prompt,
+    get_section_regeneration_prompt,
     get_ai_assistant_prompt
 )
 
@@ -39,18 +40,41 @@ class TestPromptTemplates:
         assert isinstance(prompt, str)
         assert len(prompt) > 0
     
-    def test_draft_generation_prompt(self):
-        """Test draft generation prompt."""
-        prompt = get_draft_generation_prompt(
+    def test_section_generation_prompt(self):
+        """Test single-section generation prompt."""
+        prompt = get_section_generation_prompt(
+            section_type="pricing",
+            section_title="Pricing",
+            rfp_info="Test RFP Info",
+            requirements_summary="Summary",
+            service_matches="Service matches",
+            risks_summary="Risks",
+            word_count=123
+        )
+        
+        assert '"Pricing" section' in prompt
+        assert "Test RFP Info" in prompt
+        assert "payment terms" in prompt
+        assert "Target 123 words" in prompt
+    
+    def test_section_prompts_share_context_prefix(self):
+        """Test section prompts for one RFP open with identical context text."""
+        context = dict(
             rfp_info="Test RFP Info",
             requirements_summary="Summary",
             service_matches="Service matches",
             risks_summary="Risks"
         )
+        pricing = get_section_generation_prompt(section_type="pricing", section_title="Pricing", **context)
+        timeline = get_section_generation_prompt(section_type="timeline", section_title="Timeline", **context)
+        regenerated = get_section_regeneration_prompt(
+            section_type="approach", section_title="Approach", other_sections="Other", **context
+        )
         
-        assert prompt is not None
-        assert isinstance(prompt, str)
-        assert len(prompt) > 0
+        prefix_end = pricing.index("## Task:")
+        assert "Pricing" not in pricing[:prefix_end]
+        assert timeline.startswith(pricing[:prefix_end])
+        assert regenerated.startswith(pricing[:pricing.index("\n## Task:")])
     
     def test_ai_assistant_prompt(self):
         """Test AI assistant prompt."""
@@ -69,3 +69,27 @@ class TestSessionWithMocks:
             
             assert "rfp" in mock_st.session_state
             assert mock_st.session_state["rfp"] == rfp
+    
+    def test_extract_rfp_text_reuses_identical_upload(self):
+        """Test the same bytes uploaded twice are only extracted once."""
+        mock_st = MagicMock()
+        mock_st.session_state = {}
+        processor = MagicMock()
+        processor.extract_text.return_value = ("text", {1: "text"}, 1)
+        
+        with patch('utils.session.st', mock_st):
+            from utils.session import extract_rfp_text, has_cached_extraction
+            
+            assert has_cached_extraction("abc") is False
+            first = extract_rfp_text(processor, MagicMock(), "abc")
+            
+            # "Upload Another RFP" clears the current RFP but not the cache
+            mock_st.session_state["rfp"] = None
+            assert has_cached_extraction("abc") is True
+            second = extract_rfp_text(processor, MagicMock(), "abc")
+            
+            assert first == second == ("text", {1: "text"}, 1)
+            processor.extract_text.assert_called_once()
+            
+            extract_rfp_text(processor, MagicMock(), "def")
+            assert processor.extract_text.call_count == 2